@@ -0,0 +1,55 @@
+"""
+Color Counting
+Lookup-table based HSV color range counting used by the vision module
+"""
+
+import numpy as np
+
+
+COLOR_RANGES = (
+    ('red', (0, 100, 100), (10, 255, 255)),
+    ('blue', (100, 100, 100), (130, 255, 255)),
+    ('green', (40, 100, 100), (80, 255, 255)),
+    ('yellow', (20, 100, 100), (40, 255, 255)),
+)
+COLOR_NAMES = tuple(name for name, _, _ in COLOR_RANGES)
+COLOR_MIN_PIXELS = 1000
+
+
+def _build_channel_luts() -> np.ndarray:
+    """
+    Build one 256-entry bitmask table per HSV channel
+
+    Bit i of LUT[c][x] is set when value x lies inside color i's range on
+    channel c, so ANDing the three lookups gives a pixel's color bitmask.
+
+    Returns:
+        Array of shape (3, 256) with uint8 bitmasks
+    """
+    luts = np.zeros((3, 256), dtype=np.uint8)
+    for bit, (_, lower, upper) in enumerate(COLOR_RANGES):
+        for channel in range(3):
+            luts[channel, lower[channel]:upper[channel] + 1] |= 1 << bit
+    return luts
+
+
+_CHANNEL_LUTS = _build_channel_luts()
+_BITMASK_MEMBERS = ((np.arange(1 << len(COLOR_RANGES))[:, None]
+                     >> np.arange(len(COLOR_RANGES))) & 1).astype(np.int64)
+
+
+def count_colors(hsv: np.ndarray) -> np.ndarray:
+    """
+    Count pixels falling inside each HSV range in a single pass
+
+    Args:
+        hsv: HSV image (H x W x 3, uint8)
+
+    Returns:
+        Pixel count per color, in COLOR_NAMES order
+    """
+    bits = (_CHANNEL_LUTS[0][hsv[..., 0]] &
+            _CHANNEL_LUTS[1][hsv[..., 1]] &
+            _CHANNEL_LUTS[2][hsv[..., 2]])
+    histogram = np.bincount(bits.ravel(), minlength=len(_BITMASK_MEMBERS))
+    return histogram @ _BITMASK_MEMBERS
@@ -3,8 +3,137 @@ Speech Recognition Module
 Handles listening to user voice commands
 """
 
+import audioop
+import collections
+import json
+import logging
+import queue
+import re
+import threading
+import time
+import numpy as np
 import speech_recognition as sr
-from typing import Optional
+from typing import Optional, Callable
+
+
+STREAM_SAMPLE_RATE = 16000
+STREAM_CHUNK_SIZE = 1600  # 100 ms of 16-bit mono audio at 16 kHz
+MIC_CHUNK_SIZE = 512  # 32 ms per buffer, small enough for low-latency capture
+RING_SLOTS = 64  # ~2 s of audio, covers a recognition round-trip
+PRE_ROLL_FRAMES = 8  # ~250 ms kept before speech onset
+STREAM_PRE_ROLL_CHUNKS = 3  # ~300 ms of streamed audio kept before speech onset
+STREAM_RESULT_TIMEOUT = 5  # s to wait for the final transcript after capture ends
+
+VOSK_MODEL_PATH = "model-small-en-us"
+LOCAL_MAX_WORDS = 4
+LOCAL_MIN_CONFIDENCE = 0.9
+LOCAL_HOLD_LIMIT = 2.0  # s of speech held back from the cloud while it may be a local command
+LOCAL_COMMAND_PATTERN = re.compile(
+    r'\b(time|date|screenshot|stop|exit|quit|goodbye|bye|hello|hi|hey|'
+    r'volume|sound|system|photo|picture)\b'
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingRecognitionError(Exception):
+    """
+    Streaming recognition failed; carries the phrase audio captured so far
+    """
+
+    def __init__(self, audio: Optional[sr.AudioData]):
+        """
+        Initialize the error
+
+        Args:
+            audio: Captured phrase, or None if no speech was captured
+        """
+        super().__init__("Streaming recognition failed")
+        self.audio = audio
+
+
+def _is_permanent_stream_error(error: BaseException) -> bool:
+    """
+    Check whether a streaming error will recur on every call
+
+    Args:
+        error: Exception raised by the streaming path
+
+    Returns:
+        True for missing libraries and credential or permission errors
+    """
+    if isinstance(error, ImportError):
+        return True
+
+    try:
+        from google.auth.exceptions import DefaultCredentialsError
+        from google.api_core.exceptions import PermissionDenied, Unauthenticated
+    except ImportError:
+        return False
+
+    return isinstance(error, (DefaultCredentialsError, PermissionDenied, Unauthenticated))
+
+
+class AudioRingBuffer:
+    """
+    Pre-allocated single-producer/single-consumer ring of PCM frames
+
+    The capture thread only advances write_idx and the recognizer thread
+    only advances read_idx, so no lock is needed between them.
+    """
+
+    def __init__(self, slots: int = RING_SLOTS, frame_size: int = MIC_CHUNK_SIZE):
+        """
+        Initialize the ring buffer
+
+        Args:
+            slots: Number of frames the ring can hold
+            frame_size: Samples per frame
+        """
+        self.slots = slots
+        self.frames = np.zeros((slots, frame_size), dtype=np.int16)
+        self.write_idx = 0
+        self.read_idx = 0
+        self.overruns = 0
+
+    @property
+    def fill_level(self) -> int:
+        """
+        Number of frames written but not yet consumed
+        """
+        return (self.write_idx - self.read_idx) % (2 * self.slots)
+
+    def write(self, data: bytes) -> bool:
+        """
+        Copy one frame into the ring (producer side)
+
+        Args:
+            data: Raw 16-bit PCM frame
+
+        Returns:
+            True if stored, False if the ring was full and the frame dropped
+        """
+        if self.fill_level >= self.slots:
+            self.overruns += 1
+            return False
+
+        self.frames[self.write_idx % self.slots] = np.frombuffer(data, dtype=np.int16)
+        self.write_idx = (self.write_idx + 1) % (2 * self.slots)
+        return True
+
+    def read(self) -> Optional[np.ndarray]:
+        """
+        Take the oldest frame from the ring (consumer side)
+
+        Returns:
+            Frame samples or None if the ring is empty
+        """
+        if self.fill_level == 0:
+            return None
+
+        frame = self.frames[self.read_idx % self.slots].copy()
+        self.read_idx = (self.read_idx + 1) % (2 * self.slots)
+        return frame
 
 
 class VoiceListener:
@@ -21,16 +150,49 @@ class VoiceListener:
         """
         self.recognizer = sr.Recognizer()
         self.language = language
-        self.microphone = None
+        self.microphone = sr.Microphone(sample_rate=STREAM_SAMPLE_RATE,
+                                        chunk_size=MIC_CHUNK_SIZE)
+        self.speech_client = None
+        self.streaming_enabled = True
+        self.local_enabled = True
+        self._vosk_model = None
+        self.ring_buffer = AudioRingBuffer()
+        self._calibrated = False
 
         self.recognizer.energy_threshold = 4000
         self.recognizer.dynamic_energy_threshold = True
         self.recognizer.pause_threshold = 0.8
 
+        self._calibrate()
+
+    def _calibrate(self) -> None:
+        """
+        Adjust the energy threshold for ambient noise once
+        """
+        if self._calibrated:
+            return
+
+        try:
+            with self.microphone as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+            self._calibrated = True
+        except Exception as e:
+            print(f"Error calibrating microphone: {e}")
+
+    def recalibrate(self) -> None:
+        """
+        Re-measure ambient noise (e.g. after the environment changed)
+        """
+        self._calibrated = False
+        self._calibrate()
+
     def listen(self, timeout: int = 5, phrase_time_limit: int = 10) -> Optional[str]:
         """
         Listen for voice input and convert to text
 
+        Uses streaming recognition when Google Cloud Speech is available,
+        otherwise falls back to the Google Web Speech API.
+
         Args:
             timeout: Maximum time to wait for speech to start
             phrase_time_limit: Maximum time for phrase duration
@@ -38,24 +200,80 @@ class VoiceListener:
         Returns:
             Recognized text or None if recognition fails
         """
+        if self.streaming_enabled:
+            try:
+                text = self.listen_stream(
+                    timeout=timeout,
+                    phrase_time_limit=phrase_time_limit
+                )
+                if text:
+                    print(f"You said: {text}")
+                return text
+            except StreamingRecognitionError as e:
+                self._streaming_failed(e.__cause__ or e)
+                if e.audio is not None:
+                    return self._recognize_phrase(e.audio)
+            except Exception as e:
+                self._streaming_failed(e)
+
+        self._calibrate()
+
         try:
-            with sr.Microphone() as source:
+            with self.microphone as source:
                 print("Listening...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
                 audio = self.recognizer.listen(
                     source,
                     timeout=timeout,
                     phrase_time_limit=phrase_time_limit
                 )
+        except sr.WaitTimeoutError:
+            print("Listening timed out")
+            return None
+        except Exception as e:
+            print(f"Error in listen: {e}")
+            return None
+
+        return self._recognize_phrase(audio)
+
+    def _streaming_failed(self, error: BaseException) -> None:
+        """
+        Record a streaming failure, disabling streaming if it will recur
 
+        Args:
+            error: Exception raised by the streaming path
+        """
+        if _is_permanent_stream_error(error):
+            logger.warning("Streaming recognition disabled: %s", error)
+            self.streaming_enabled = False
+        else:
+            logger.warning("Streaming recognition failed, falling back for this phrase: %s", error)
+
+    def _recognize_phrase(self, audio: sr.AudioData) -> Optional[str]:
+        """
+        Recognize a captured phrase, trying the offline model first
+
+        Args:
+            audio: Captured phrase
+
+        Returns:
+            Recognized text or None if recognition fails
+        """
+        try:
             print("Recognizing...")
+            local_recognizer = self._create_local_recognizer()
+            if local_recognizer is not None:
+                local_recognizer.AcceptWaveform(
+                    audio.get_raw_data(convert_rate=STREAM_SAMPLE_RATE, convert_width=2)
+                )
+                command = self._local_command(local_recognizer.FinalResult())
+                if command:
+                    print(f"You said: {command}")
+                    return command
+
             text = self.recognizer.recognize_google(audio, language=self.language)
             print(f"You said: {text}")
             return text.lower()
 
-        except sr.WaitTimeoutError:
-            print("Listening timed out")
-            return None
         except sr.UnknownValueError:
             print("Could not understand audio")
             return None
@@ -63,32 +281,402 @@ class VoiceListener:
             print(f"Could not request results; {e}")
             return None
         except Exception as e:
-            print(f"Error in listen: {e}")
+            print(f"Error recognizing audio: {e}")
+            return None
+
+    def listen_stream(self, callback: Optional[Callable[[str], None]] = None,
+                      timeout: int = 5, phrase_time_limit: int = 10) -> Optional[str]:
+        """
+        Listen and recognize speech while the user is still talking
+
+        Audio is captured in ~100 ms chunks and streamed to Google Cloud
+        Speech, so interim results arrive before the phrase has ended.
+        Short known commands recognized confidently by the offline Vosk
+        model are returned as soon as the phrase ends, without sending any
+        audio to the cloud.
+
+        If the stream fails or no final transcript arrives in time, a
+        StreamingRecognitionError carrying the captured phrase is raised so
+        the caller can recognize it another way.
+
+        Args:
+            callback: Function called with each interim and final transcript
+            timeout: Maximum time to wait for speech to start
+            phrase_time_limit: Maximum time for phrase duration
+
+        Returns:
+            Final recognized text or None if nothing was recognized
+        """
+        from google.cloud import speech
+
+        self._calibrate()
+
+        if self.speech_client is None:
+            self.speech_client = speech.SpeechClient()
+
+        audio_queue = queue.Queue()
+        result_queue = queue.Queue()
+        stop_event = threading.Event()
+        captured = []
+
+        capture_thread = threading.Thread(
+            target=self._capture_stream,
+            args=(audio_queue, result_queue, stop_event, captured, timeout, phrase_time_limit)
+        )
+        recognize_thread = threading.Thread(
+            target=self._recognize_stream,
+            args=(speech, audio_queue, result_queue, stop_event, callback)
+        )
+
+        print("Listening...")
+        for thread in (capture_thread, recognize_thread):
+            thread.daemon = True
+            thread.start()
+
+        try:
+            try:
+                source, result = result_queue.get(
+                    timeout=timeout + phrase_time_limit + STREAM_RESULT_TIMEOUT
+                )
+            except queue.Empty:
+                source, result = 'error', TimeoutError("No streaming result received")
+
+            if source == 'error':
+                # Let the phrase finish so the fallback gets all of it
+                capture_thread.join(timeout=timeout + phrase_time_limit)
+        finally:
+            stop_event.set()
+            capture_thread.join(timeout=1)
+
+        if source == 'error':
+            audio = sr.AudioData(b''.join(captured), STREAM_SAMPLE_RATE, 2) if captured else None
+            raise StreamingRecognitionError(audio) from result
+
+        if source == 'local' and callback:
+            callback(result)
+
+        return result or None
+
+    def _recognize_stream(self, speech, audio_queue: queue.Queue, result_queue: queue.Queue,
+                          stop_event: threading.Event,
+                          callback: Optional[Callable[[str], None]]) -> None:
+        """
+        Stream queued audio to Google Cloud Speech and post the final result
+
+        Args:
+            speech: google.cloud.speech module
+            audio_queue: Queue of raw PCM chunks (None marks the end)
+            result_queue: Queue receiving (source, text) or ('error', exception)
+            stop_event: Event set once a result has been consumed
+            callback: Function called with each interim and final transcript
+        """
+        # Capture only queues audio once speech starts; open no stream for silence
+        first_chunk = audio_queue.get()
+        if first_chunk is None:
+            result_queue.put(('google', None))
+            return
+
+        def request_generator():
+            chunk = first_chunk
+            while chunk is not None:
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+                chunk = audio_queue.get()
+
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=STREAM_SAMPLE_RATE,
+                language_code=self.language
+            ),
+            interim_results=True
+        )
+
+        try:
+            responses = self.speech_client.streaming_recognize(
+                config=streaming_config,
+                requests=request_generator()
+            )
+
+            for response in responses:
+                for result in response.results:
+                    if stop_event.is_set():
+                        return
+                    if not result.alternatives:
+                        continue
+
+                    transcript = result.alternatives[0].transcript.strip().lower()
+                    if callback:
+                        callback(transcript)
+
+                    if result.is_final:
+                        result_queue.put(('google', transcript))
+                        return
+
+            result_queue.put(('google', None))
+        except Exception as e:
+            result_queue.put(('error', e))
+
+    def _capture_stream(self, audio_queue: queue.Queue, result_queue: queue.Queue,
+                        stop_event: threading.Event, captured: list, timeout: int,
+                        phrase_time_limit: int) -> None:
+        """
+        Push microphone chunks into a queue until silence or time limit
+
+        Nothing is queued until speech energy is detected; the chunks just
+        before onset are then queued as a short pre-roll. Every chunk is
+        also fed to the offline recognizer. While the phrase could still be
+        a short local command, its audio is held back; it is released to the
+        cloud stream once the phrase grows too long, or at the end if the
+        offline recognizer does not accept it. An accepted command is posted
+        to result_queue and the cloud is never called.
+
+        Args:
+            audio_queue: Queue receiving raw PCM chunks (None marks the end)
+            result_queue: Queue receiving ('local', text) on a local match
+            stop_event: Event set by the consumer to stop capturing
+            captured: List receiving every queued chunk, kept for fallback recognition
+            timeout: Maximum time to wait for speech to start
+            phrase_time_limit: Maximum time for phrase duration
+        """
+        chunk_duration = STREAM_CHUNK_SIZE / STREAM_SAMPLE_RATE
+        waited = 0.0
+        spoken = 0.0
+        silence = 0.0
+        heard_speech = False
+        pre_roll = collections.deque(maxlen=STREAM_PRE_ROLL_CHUNKS)
+        pending = []
+        local_recognizer = self._create_local_recognizer()
+        streaming = local_recognizer is None
+
+        try:
+            with self.microphone as source:
+                while not stop_event.is_set():
+                    chunk = source.stream.read(STREAM_CHUNK_SIZE)
+                    if local_recognizer is not None:
+                        local_recognizer.AcceptWaveform(chunk)
+
+                    energy = audioop.rms(chunk, source.SAMPLE_WIDTH)
+                    if energy > self.recognizer.energy_threshold:
+                        if not heard_speech:
+                            pending.extend(pre_roll)
+                            captured.extend(pre_roll)
+                            pre_roll.clear()
+                        heard_speech = True
+                        silence = 0.0
+                    elif heard_speech:
+                        silence += chunk_duration
+
+                    if heard_speech:
+                        pending.append(chunk)
+                        captured.append(chunk)
+                        spoken += chunk_duration
+
+                        if not streaming and (spoken >= LOCAL_HOLD_LIMIT or
+                                              self._partial_word_count(local_recognizer) > LOCAL_MAX_WORDS):
+                            streaming = True
+                        if streaming:
+                            for buffered in pending:
+                                audio_queue.put(buffered)
+                            pending.clear()
+
+                        if silence >= self.recognizer.pause_threshold or spoken >= phrase_time_limit:
+                            break
+                    else:
+                        pre_roll.append(chunk)
+                        waited += chunk_duration
+                        if waited >= timeout:
+                            print("Listening timed out")
+                            break
+
+            if heard_speech and local_recognizer is not None:
+                command = self._local_command(local_recognizer.FinalResult())
+                if command:
+                    result_queue.put(('local', command))
+                elif not streaming:
+                    for buffered in pending:
+                        audio_queue.put(buffered)
+        except Exception as e:
+            print(f"Error capturing audio: {e}")
+        finally:
+            audio_queue.put(None)
+
+    def _create_local_recognizer(self):
+        """
+        Create an offline Vosk recognizer, loading the model on first use
+
+        Returns:
+            KaldiRecognizer or None if Vosk or its model is unavailable
+        """
+        if not self.local_enabled:
             return None
 
+        try:
+            import vosk
+
+            if self._vosk_model is None:
+                vosk.SetLogLevel(-1)
+                self._vosk_model = vosk.Model(VOSK_MODEL_PATH)
+
+            recognizer = vosk.KaldiRecognizer(self._vosk_model, STREAM_SAMPLE_RATE)
+            recognizer.SetWords(True)
+            return recognizer
+        except Exception as e:
+            print(f"Offline recognizer unavailable: {e}")
+            self.local_enabled = False
+            return None
+
+    def _partial_word_count(self, recognizer) -> int:
+        """
+        Count the words in the offline recognizer's partial transcript
+
+        Args:
+            recognizer: KaldiRecognizer fed with the current phrase
+
+        Returns:
+            Number of words recognized so far
+        """
+        return len(json.loads(recognizer.PartialResult()).get('partial', '').split())
+
+    def _local_command(self, result_json: str) -> Optional[str]:
+        """
+        Accept an offline result only if it is a short, confident, known command
+
+        Args:
+            result_json: Vosk result JSON
+
+        Returns:
+            Recognized command text or None
+        """
+        result = json.loads(result_json)
+        text = result.get('text', '').strip()
+        words = result.get('result', [])
+
+        if not text or len(text.split()) > LOCAL_MAX_WORDS:
+            return None
+        if not LOCAL_COMMAND_PATTERN.search(text):
+            return None
+        if not words or min(word['conf'] for word in words) < LOCAL_MIN_CONFIDENCE:
+            return None
+
+        return text
+
+    @property
+    def fill_level(self) -> int:
+        """
+        Frames waiting in the background capture ring buffer
+        """
+        return self.ring_buffer.fill_level
+
     def listen_background(self, callback):
         """
         Listen in background mode (non-blocking)
 
+        A capture thread copies microphone frames into a pre-allocated ring
+        buffer; a recognizer thread drains it, splits phrases on silence and
+        recognizes them.
+
         Args:
             callback: Function to call with recognized text
+
+        Returns:
+            Function that stops background listening when called
         """
-        def audio_callback(recognizer, audio):
-            try:
-                text = recognizer.recognize_google(audio, language=self.language)
-                callback(text.lower())
-            except sr.UnknownValueError:
-                pass
-            except sr.RequestError as e:
-                print(f"Recognition error: {e}")
+        self._calibrate()
 
-        if self.microphone is None:
-            self.microphone = sr.Microphone()
+        self.ring_buffer = AudioRingBuffer()
+        stop_event = threading.Event()
 
-        with self.microphone as source:
-            self.recognizer.adjust_for_ambient_noise(source)
+        capture_thread = threading.Thread(
+            target=self._capture_ring,
+            args=(self.ring_buffer, stop_event)
+        )
+        recognize_thread = threading.Thread(
+            target=self._recognize_ring,
+            args=(self.ring_buffer, stop_event, callback)
+        )
+        for thread in (capture_thread, recognize_thread):
+            thread.daemon = True
+            thread.start()
 
-        return self.recognizer.listen_in_background(self.microphone, audio_callback)
+        def stopper(wait_for_stop: bool = True) -> None:
+            stop_event.set()
+            if wait_for_stop:
+                capture_thread.join()
+                recognize_thread.join()
+
+        return stopper
+
+    def _capture_ring(self, ring: AudioRingBuffer, stop_event: threading.Event) -> None:
+        """
+        Producer loop: read microphone frames into the ring buffer
+
+        Args:
+            ring: Ring buffer to fill
+            stop_event: Event that ends the loop
+        """
+        try:
+            with self.microphone as source:
+                while not stop_event.is_set():
+                    ring.write(source.stream.read(MIC_CHUNK_SIZE))
+        except Exception as e:
+            print(f"Error capturing audio: {e}")
+            stop_event.set()
+
+    def _recognize_ring(self, ring: AudioRingBuffer, stop_event: threading.Event,
+                        callback: Callable[[str], None]) -> None:
+        """
+        Consumer loop: segment phrases from the ring buffer and recognize them
+
+        Args:
+            ring: Ring buffer to drain
+            stop_event: Event that ends the loop
+            callback: Function to call with recognized text
+        """
+        frame_duration = MIC_CHUNK_SIZE / STREAM_SAMPLE_RATE
+        pre_roll = collections.deque(maxlen=PRE_ROLL_FRAMES)
+        phrase = []
+        silence = 0.0
+
+        while not stop_event.is_set():
+            frame = ring.read()
+            if frame is None:
+                time.sleep(frame_duration / 2)
+                continue
+
+            energy = np.sqrt(np.mean(frame.astype(np.float32) ** 2))
+            if energy > self.recognizer.energy_threshold:
+                if not phrase:
+                    phrase.extend(pre_roll)
+                    pre_roll.clear()
+                phrase.append(frame)
+                silence = 0.0
+            elif phrase:
+                phrase.append(frame)
+                silence += frame_duration
+                if silence >= self.recognizer.pause_threshold:
+                    audio = sr.AudioData(np.concatenate(phrase).tobytes(),
+                                         STREAM_SAMPLE_RATE, 2)
+                    phrase = []
+                    silence = 0.0
+                    self._recognize_audio(audio, callback)
+            else:
+                pre_roll.append(frame)
+
+    def _recognize_audio(self, audio: sr.AudioData, callback: Callable[[str], None]) -> None:
+        """
+        Recognize a captured phrase and pass the text to callback
+
+        Args:
+            audio: Captured phrase
+            callback: Function to call with recognized text
+        """
+        try:
+            text = self.recognizer.recognize_google(audio, language=self.language)
+            callback(text.lower())
+        except sr.UnknownValueError:
+            pass
+        except sr.RequestError as e:
+            print(f"Recognition error: {e}")
 
 
 def listen_once(language: str = "en-US", timeout: int = 5) -> Optional[str]:
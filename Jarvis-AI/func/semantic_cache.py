@@ -0,0 +1,135 @@
+"""
+Semantic Cache
+Embedding-based response cache for AI conversations
+"""
+
+import threading
+import numpy as np
+from typing import Optional, Tuple
+
+
+EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+SIMILARITY_THRESHOLD = 0.92
+MAX_ENTRIES = 500
+
+
+class SemanticCache:
+    """
+    Cache of AI responses keyed by sentence embeddings of the question
+
+    Lookups compare the normalized question vector against every cached
+    vector in one matrix product; the least recently used entry is
+    replaced once the cache is full.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize semantic cache
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+
+        self._model = None
+        self._available = True
+        self._vectors = None
+        self._responses = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+
+    def _get_model(self):
+        """
+        Get the embedding model, loading fastembed on first use
+
+        Returns:
+            TextEmbedding model or None if fastembed is unavailable
+        """
+        if self._model is None and self._available:
+            try:
+                from fastembed import TextEmbedding
+                self._model = TextEmbedding(EMBEDDING_MODEL)
+            except Exception as e:
+                print(f"Semantic cache disabled: {e}")
+                self._available = False
+
+        return self._model
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Compute the normalized embedding of a text
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Unit-length vector or None if embeddings are unavailable
+        """
+        model = self._get_model()
+        if model is None:
+            return None
+
+        try:
+            vector = np.asarray(next(iter(model.embed([text]))), dtype=np.float32)
+        except Exception as e:
+            print(f"Error computing embedding: {e}")
+            return None
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, text: str) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """
+        Find a cached response for a similar question
+
+        Args:
+            text: Question text
+
+        Returns:
+            Tuple of (cached response or None, question embedding or None)
+        """
+        vector = self.embed(text)
+        if vector is None:
+            return None, None
+
+        with self.lock:
+            if not self._responses:
+                return None, vector
+
+            similarities = self._vectors[:len(self._responses)] @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None, vector
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            return self._responses[best], vector
+
+    def store(self, vector: Optional[np.ndarray], response: str) -> None:
+        """
+        Cache a response under a question embedding
+
+        Args:
+            vector: Question embedding returned by lookup
+            response: Response text to cache
+        """
+        if vector is None or not response:
+            return
+
+        with self.lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+            if len(self._responses) < self.max_entries:
+                slot = len(self._responses)
+                self._responses.append(response)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._responses[slot] = response
+
+            self._vectors[slot] = vector
+            self._clock += 1
+            self._last_used[slot] = self._clock
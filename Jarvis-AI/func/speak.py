@@ -3,17 +3,74 @@ Text-to-Speech Module
 Handles voice output for the assistant
 """
 
-import pyttsx3
+import os
+import queue
+import re
+import tempfile
 import threading
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Optional
 import platform
 
+try:
+    import simpleaudio
+except ImportError:
+    simpleaudio = None
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences on terminal punctuation
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of non-empty sentences
+    """
+    return [sentence for sentence in re.split(r'(?<=[.!?])\s+', text.strip()) if sentence]
+
 
 class VoiceSpeaker:
     """
     Voice speaker class for text-to-speech output
     """
 
+    _engine = None
+    _engine_lock = threading.Lock()
+    _voices = None
+    # Held while the shared engine runs its loop, across all speaker instances
+    lock = threading.Lock()
+
+    @classmethod
+    def _get_engine(cls):
+        """
+        Get the shared pyttsx3 engine, initializing it on first use
+
+        Returns:
+            pyttsx3 engine
+        """
+        with cls._engine_lock:
+            if cls._engine is None:
+                import pyttsx3
+                cls._engine = pyttsx3.init()
+            return cls._engine
+
+    @classmethod
+    def _get_voices(cls) -> list:
+        """
+        Get installed voices, enumerating them only once
+
+        Returns:
+            List of voice objects
+        """
+        engine = cls._get_engine()
+        with cls._engine_lock:
+            if cls._voices is None:
+                cls._voices = engine.getProperty('voices')
+            return cls._voices
+
     def __init__(self, rate: int = 150, volume: float = 0.9, voice_id: Optional[int] = None):
         """
         Initialize the voice speaker
@@ -23,16 +80,23 @@ class VoiceSpeaker:
             volume: Volume level (0.0 to 1.0)
             voice_id: Voice ID to use (0 for male, 1 for female, None for default)
         """
-        self.engine = pyttsx3.init()
+        self.engine = self._get_engine()
         self.engine.setProperty('rate', rate)
         self.engine.setProperty('volume', volume)
 
-        voices = self.engine.getProperty('voices')
-        if voice_id is not None and 0 <= voice_id < len(voices):
-            self.engine.setProperty('voice', voices[voice_id].id)
+        if voice_id is not None:
+            voices = self._get_voices()
+            if 0 <= voice_id < len(voices):
+                self.engine.setProperty('voice', voices[voice_id].id)
 
         self.is_speaking = False
-        self.lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._worker = None
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._synth_pool = ThreadPoolExecutor(max_workers=1)
+        self._play_obj = None
+        self.speaking = threading.Event()
 
     def speak(self, text: str, async_mode: bool = False) -> None:
         """
@@ -45,38 +109,185 @@ class VoiceSpeaker:
         if not text:
             return
 
+        generation = self._generation
+        self.speaking.set()
+
         if async_mode:
-            thread = threading.Thread(target=self._speak_sync, args=(text,))
-            thread.daemon = True
-            thread.start()
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._speech_worker)
+                self._worker.daemon = True
+                self._worker.start()
+            self._queue.put((generation, text))
         else:
-            self._speak_sync(text)
+            self._speak_sync(text, generation)
+            self._mark_idle()
+
+    def _is_stale(self, generation: int) -> bool:
+        """
+        Check whether stop() was called after speech was requested
+
+        Args:
+            generation: Value of the stop counter when speech was requested
+
+        Returns:
+            True if the speech has been interrupted
+        """
+        return generation != self._generation
+
+    def _speech_worker(self) -> None:
+        """
+        Background loop speaking queued text in order
+
+        Items queued before the latest stop() are skipped.
+        """
+        while True:
+            generation, text = self._queue.get()
+            try:
+                if not self._is_stale(generation):
+                    self._speak_sync(text, generation)
+            finally:
+                self._queue.task_done()
+                self._mark_idle()
+
+    def _mark_idle(self) -> None:
+        """
+        Clear the speaking flag once nothing is playing or queued
+        """
+        if not self.is_speaking and self._queue.unfinished_tasks == 0:
+            self.speaking.clear()
 
-    def _speak_sync(self, text: str) -> None:
+    def wait_until_done(self) -> None:
+        """
+        Block until all queued speech has been spoken
+        """
+        self._queue.join()
+
+    def _speak_sync(self, text: str, generation: int) -> None:
         """
         Synchronous speak method
 
         Args:
             text: Text to speak
+            generation: Stop counter value the speech belongs to
         """
         with self.lock:
             try:
                 self.is_speaking = True
                 print(f"JARVIS: {text}")
-                self.engine.say(text)
-                self.engine.runAndWait()
+
+                sentences = _split_sentences(text)
+                if simpleaudio is not None and len(sentences) > 1:
+                    self._speak_pipelined(sentences, generation)
+                else:
+                    self.engine.say(text)
+                    self._run_engine(generation)
             except Exception as e:
                 print(f"Error in speak: {e}")
             finally:
                 self.is_speaking = False
 
+    def _speak_pipelined(self, sentences: List[str], generation: int) -> None:
+        """
+        Play sentences in order while later ones are still being synthesized
+
+        pyttsx3 can only drive one engine per process, so synthesis runs on a
+        single background worker and overlaps with playback on this thread.
+
+        Args:
+            sentences: Sentences to speak
+            generation: Stop counter value the speech belongs to
+        """
+        futures = [self._synth_pool.submit(self._synthesize, sentence, generation)
+                   for sentence in sentences]
+
+        try:
+            for future in futures:
+                if self._is_stale(generation):
+                    break
+
+                path = future.result()
+                try:
+                    self._play_obj = simpleaudio.WaveObject.from_wave_file(path).play()
+                    self._play_obj.wait_done()
+                finally:
+                    self._play_obj = None
+                    os.remove(path)
+        finally:
+            # The engine must be idle before this lock holder lets anyone else use it
+            pending = [future for future in futures if not future.cancel()]
+            wait(pending)
+            for future in pending:
+                self._discard_wav(future)
+
+    @staticmethod
+    def _discard_wav(future) -> None:
+        """
+        Remove a synthesized WAV file that was not played
+
+        Args:
+            future: Completed synthesis future
+        """
+        if future.exception() is None and os.path.exists(future.result()):
+            os.remove(future.result())
+
+    def _synthesize(self, sentence: str, generation: int) -> str:
+        """
+        Render a sentence to a temporary WAV file
+
+        Args:
+            sentence: Sentence to synthesize
+            generation: Stop counter value the speech belongs to
+
+        Returns:
+            Path to the WAV file
+        """
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
+            path = tmp.name
+
+        self.engine.save_to_file(sentence, path)
+        self._run_engine(generation)
+        return path
+
+    def _run_engine(self, generation: int) -> None:
+        """
+        Drive the engine's event loop until it is idle or stop() is called
+
+        Unlike runAndWait(), iterating in short slices lets stop() take
+        effect between iterations instead of after the whole utterance.
+
+        Args:
+            generation: Stop counter value the speech belongs to
+        """
+        self.engine.startLoop(False)
+        try:
+            while self.engine.isBusy() and not self._is_stale(generation):
+                self.engine.iterate()
+                time.sleep(0.005)
+        finally:
+            self.engine.endLoop()
+
     def stop(self) -> None:
         """
-        Stop current speech
+        Stop current speech and drop any queued speech
+
+        Bumping the stop counter marks everything requested so far as stale,
+        so speech queued by an interrupted answer cannot resume later.
         """
+        with self._generation_lock:
+            self._generation += 1
+
+        try:
+            while True:
+                self._queue.get_nowait()
+                self._queue.task_done()
+        except queue.Empty:
+            pass
+
         try:
-            self.engine.stop()
-            self.is_speaking = False
+            if self._play_obj is not None:
+                self._play_obj.stop()
+            if self.is_speaking:
+                self.engine.stop()
         except Exception as e:
             print(f"Error stopping speech: {e}")
 
@@ -105,7 +316,7 @@ class VoiceSpeaker:
         Returns:
             List of voice objects
         """
-        return self.engine.getProperty('voices')
+        return self._get_voices()
 
 
 _global_speaker = None
@@ -6,11 +6,16 @@ Handles simple automation tasks like opening apps, screenshots, etc.
 import os
 import platform
 import subprocess
+import threading
 import webbrowser
-import pyautogui
 import datetime
-import psutil
-from typing import Optional, Dict
+import time
+from collections import defaultdict
+from typing import Optional, Dict, List
+
+
+CPU_SAMPLE_INTERVAL = 0.5
+USAGE_CACHE_TTL = 1.0
 
 
 class TaskAutomation:
@@ -23,6 +28,40 @@ class TaskAutomation:
         Initialize task automation
         """
         self.system = platform.system()
+        self._proc_cache: Dict[str, List[int]] = {}
+        self._proc_cache_ts = 0.0
+        # mss handles are bound to the thread that created them
+        self._sct_local = threading.local()
+
+        self._last_cpu = None
+        self._usage_cache = None
+        self._usage_cache_ts = 0.0
+        self._sampler = None
+        self._sampler_lock = threading.Lock()
+
+    def _start_cpu_sampler(self) -> None:
+        """
+        Start the background CPU sampler if it is not running yet
+        """
+        with self._sampler_lock:
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._cpu_sampler)
+                self._sampler.daemon = True
+                self._sampler.start()
+
+    def _cpu_sampler(self) -> None:
+        """
+        Background loop keeping the latest CPU usage sample
+        """
+        try:
+            import psutil
+
+            psutil.cpu_percent(interval=None)
+            while True:
+                time.sleep(CPU_SAMPLE_INTERVAL)
+                self._last_cpu = psutil.cpu_percent(interval=None)
+        except Exception as e:
+            print(f"Error sampling CPU usage: {e}")
 
     def get_time(self) -> str:
         """
@@ -56,7 +95,7 @@ class TaskAutomation:
             "date": self.get_date()
         }
 
-    def take_screenshot(self, filename: Optional[str] = None) -> str:
+    def take_screenshot(self, filename: Optional[str] = None) -> Optional[str]:
         """
         Take a screenshot
 
@@ -64,23 +103,32 @@ class TaskAutomation:
             filename: Optional filename to save screenshot
 
         Returns:
-            Path to saved screenshot
+            Path to saved screenshot or None
         """
         if filename is None:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
+            filename = f"screenshot_{timestamp}.jpg"
 
         screenshot_path = os.path.join(os.path.expanduser("~"), "Pictures", filename)
 
         try:
-            screenshot = pyautogui.screenshot()
-            screenshot.save(screenshot_path)
+            import cv2
+            import mss
+            import numpy as np
+            from .vision import image_write_params
+
+            sct = getattr(self._sct_local, 'sct', None)
+            if sct is None:
+                sct = self._sct_local.sct = mss.mss()
+
+            image = sct.grab(sct.monitors[0])
+            frame = np.asarray(image)[:, :, :3]
+            if not cv2.imwrite(screenshot_path, frame, image_write_params(screenshot_path)):
+                raise IOError(f"could not write {screenshot_path}")
             return screenshot_path
         except Exception as e:
             print(f"Error taking screenshot: {e}")
-            screenshot_path = filename
-            pyautogui.screenshot(screenshot_path)
-            return screenshot_path
+            return None
 
     def open_application(self, app_name: str) -> bool:
         """
@@ -109,11 +157,18 @@ class TaskAutomation:
 
         try:
             if self.system == "Windows":
-                os.startfile(app_command) if app_command.endswith('.exe') else subprocess.Popen([app_command])
+                try:
+                    os.startfile(app_command)
+                except OSError:
+                    subprocess.Popen(
+                        [app_command],
+                        creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
+                        close_fds=True
+                    )
             elif self.system == "Darwin":
                 subprocess.Popen(["open", "-a", app_command])
             else:
-                subprocess.Popen([app_command])
+                subprocess.Popen([app_command], start_new_session=True)
             return True
         except Exception as e:
             print(f"Error opening application: {e}")
@@ -146,9 +201,19 @@ class TaskAutomation:
             Dictionary with system info
         """
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            import psutil
+
+            # Sampling starts on first use; this call falls back to a blocking read
+            self._start_cpu_sampler()
+            cpu_percent = self._last_cpu
+            if cpu_percent is None:
+                cpu_percent = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+
+            now = time.monotonic()
+            if self._usage_cache is None or now - self._usage_cache_ts >= USAGE_CACHE_TTL:
+                self._usage_cache = (psutil.virtual_memory(), psutil.disk_usage('/'))
+                self._usage_cache_ts = now
+            memory, disk = self._usage_cache
 
             return {
                 "system": self.system,
@@ -172,15 +237,51 @@ class TaskAutomation:
             True if successful, False otherwise
         """
         try:
-            for proc in psutil.process_iter(['name']):
-                if app_name.lower() in proc.info['name'].lower():
-                    proc.kill()
-                    return True
+            import psutil
+
+            name = app_name.lower()
+            self._refresh_proc_cache()
+
+            candidates = [(name, self._proc_cache.get(name, []))]
+            candidates += [(proc_name, pids) for proc_name, pids in self._proc_cache.items()
+                           if proc_name != name and name in proc_name]
+
+            for proc_name, pids in candidates:
+                for pid in pids:
+                    try:
+                        proc = psutil.Process(pid)
+                        if proc.is_running() and proc.name().lower() == proc_name:
+                            proc.kill()
+                            self._proc_cache_ts = 0.0
+                            return True
+                    except psutil.NoSuchProcess:
+                        continue
             return False
         except Exception as e:
             print(f"Error closing application: {e}")
             return False
 
+    def _refresh_proc_cache(self, max_age: float = 2.0) -> None:
+        """
+        Rebuild the process name to PID map if it is older than max_age
+
+        Args:
+            max_age: Maximum cache age in seconds
+        """
+        now = time.monotonic()
+        if now - self._proc_cache_ts < max_age:
+            return
+
+        import psutil
+
+        cache = defaultdict(list)
+        for proc in psutil.process_iter(['pid', 'name']):
+            if proc.info['name']:
+                cache[proc.info['name'].lower()].append(proc.info['pid'])
+
+        self._proc_cache = dict(cache)
+        self._proc_cache_ts = now
+
     def volume_control(self, action: str) -> bool:
         """
         Control system volume
@@ -193,6 +294,8 @@ class TaskAutomation:
         """
         try:
             if self.system == "Windows":
+                import pyautogui
+
                 if action == "up":
                     pyautogui.press("volumeup")
                 elif action == "down":
@@ -208,4 +311,19 @@ class TaskAutomation:
             return False
 
 
-task_automation = TaskAutomation()
+_task_automation = None
+
+
+def get_task_automation() -> TaskAutomation:
+    """
+    Get the shared task automation instance, creating it on first use
+
+    Returns:
+        TaskAutomation instance
+    """
+    global _task_automation
+
+    if _task_automation is None:
+        _task_automation = TaskAutomation()
+
+    return _task_automation
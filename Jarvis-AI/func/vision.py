@@ -3,10 +3,39 @@ Computer Vision Module
 Handles face detection, object recognition, and OCR
 """
 
-import cv2
-import numpy as np
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
 import os
+import platform
+import threading
+import time
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+OCR_MAX_EDGE = 1280
+JPEG_QUALITY = 85
+CAMERA_IDLE_TIMEOUT = 30
+
+
+def image_write_params(path: str) -> List[int]:
+    """
+    Get cv2.imwrite parameters for fast encoding of the given file type
+
+    Args:
+        path: Output image path
+
+    Returns:
+        Encoder parameters (empty for non-JPEG files)
+    """
+    import cv2
+
+    if os.path.splitext(path)[1].lower() not in ('.jpg', '.jpeg'):
+        return []
+
+    return [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0]
 
 
 class VisionSystem:
@@ -14,6 +43,9 @@ class VisionSystem:
     Class for computer vision operations
     """
 
+    _cascades = {}
+    _cascade_lock = threading.Lock()
+
     def __init__(self, camera_index: int = 0):
         """
         Initialize vision system
@@ -25,25 +57,163 @@ class VisionSystem:
         self.face_cascade = None
         self.eye_cascade = None
         self.ocr_reader = None
+        self.use_opencl = False
+
+        self._cap = None
+        self._reader_thread = None
+        self._capture_lock = threading.Lock()
+        self._last_request = 0.0
+        self._stop_capture = threading.Event()
+        self._frame_ready = threading.Event()
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._back_frame = None
+
+    @classmethod
+    def _get_cascade(cls, filename: str):
+        """
+        Get a Haar cascade, parsing its XML only once per process
+
+        Args:
+            filename: Cascade file name in OpenCV's haarcascades directory
 
-        self._load_face_detection()
+        Returns:
+            Loaded CascadeClassifier
+        """
+        import cv2
+
+        with cls._cascade_lock:
+            if filename not in cls._cascades:
+                path = os.path.join(cv2.data.haarcascades, filename)
+                cls._cascades[filename] = cv2.CascadeClassifier(path)
+            return cls._cascades[filename]
 
     def _load_face_detection(self) -> None:
         """
         Load face detection cascade classifiers
         """
         try:
-            cascade_path = cv2.data.haarcascades
-            face_cascade_path = os.path.join(cascade_path, 'haarcascade_frontalface_default.xml')
-            eye_cascade_path = os.path.join(cascade_path, 'haarcascade_eye.xml')
+            import cv2
+            self.use_opencl = cv2.ocl.haveOpenCL()
 
-            self.face_cascade = cv2.CascadeClassifier(face_cascade_path)
-            self.eye_cascade = cv2.CascadeClassifier(eye_cascade_path)
+            self.face_cascade = self._get_cascade('haarcascade_frontalface_default.xml')
+            self.eye_cascade = self._get_cascade('haarcascade_eye.xml')
         except Exception as e:
             print(f"Error loading face detection: {e}")
 
+    def _ensure_capture(self) -> bool:
+        """
+        Open the camera once and start the background frame reader
+
+        Returns:
+            True if the camera is open
+        """
+        with self._capture_lock:
+            self._last_request = time.monotonic()
+
+            if self._cap is not None and self._cap.isOpened():
+                return True
+
+            import cv2
+
+            if platform.system() == "Windows":
+                cap = cv2.VideoCapture(self.camera_index, cv2.CAP_DSHOW)
+            else:
+                cap = cv2.VideoCapture(self.camera_index)
+
+            if not cap.isOpened():
+                cap.release()
+                return False
+
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self._cap = cap
+            self._stop_capture.clear()
+            self._frame_ready.clear()
+            self._reader_thread = threading.Thread(target=self._reader_loop, args=(cap,))
+            self._reader_thread.daemon = True
+            self._reader_thread.start()
+            return True
+
+    def _reader_loop(self, cap) -> None:
+        """
+        Keep the most recent camera frame available, dropping stale ones
+
+        The camera is released once no frame has been requested for
+        CAMERA_IDLE_TIMEOUT seconds.
+
+        Args:
+            cap: Opened VideoCapture owned by this reader
+        """
+        while not self._stop_capture.is_set():
+            if time.monotonic() - self._last_request > CAMERA_IDLE_TIMEOUT:
+                with self._capture_lock:
+                    # A request may have arrived while waiting for the lock
+                    if time.monotonic() - self._last_request > CAMERA_IDLE_TIMEOUT:
+                        self._release_capture()
+                        return
+
+            if not cap.grab():
+                time.sleep(0.01)
+                continue
+
+            ret, frame = cap.retrieve(self._back_frame)
+            if not ret:
+                continue
+
+            with self._frame_lock:
+                self._back_frame = self._latest_frame
+                self._latest_frame = frame
+            self._frame_ready.set()
+
+    def _release_capture(self) -> None:
+        """
+        Release the camera and drop buffered frames (caller holds _capture_lock)
+        """
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+        self._reader_thread = None
+        with self._frame_lock:
+            self._latest_frame = None
+            self._back_frame = None
+        self._frame_ready.clear()
+
+    def _get_latest_frame(self, timeout: float = 2.0) -> Optional["np.ndarray"]:
+        """
+        Get a copy of the most recent camera frame
+
+        Args:
+            timeout: Maximum time to wait for the first frame
+
+        Returns:
+            Frame or None if the camera is unavailable
+        """
+        if not self._ensure_capture():
+            return None
+
+        if not self._frame_ready.wait(timeout):
+            return None
+
+        with self._frame_lock:
+            if self._latest_frame is None:
+                return None
+            return self._latest_frame.copy()
+
+    def close_camera(self) -> None:
+        """
+        Stop the frame reader and release the camera
+        """
+        self._stop_capture.set()
+        reader = self._reader_thread
+        if reader is not None:
+            reader.join(timeout=1)
+
+        with self._capture_lock:
+            self._release_capture()
+
     def detect_faces(self, image_path: Optional[str] = None,
-                     use_camera: bool = False) -> Tuple[int, Optional[np.ndarray]]:
+                     use_camera: bool = False) -> Tuple[int, Optional["np.ndarray"]]:
         """
         Detect faces in image or camera feed
 
@@ -54,26 +224,32 @@ class VisionSystem:
         Returns:
             Tuple of (number of faces, annotated image)
         """
+        if self.face_cascade is None:
+            self._load_face_detection()
+
         if self.face_cascade is None:
             print("Face detection not initialized")
             return 0, None
 
         try:
+            import cv2
+
             if use_camera:
-                cap = cv2.VideoCapture(self.camera_index)
-                ret, frame = cap.read()
-                cap.release()
-                if not ret:
-                    return 0, None
-                image = frame
+                image = self._get_latest_frame()
             elif image_path:
                 image = cv2.imread(image_path)
             else:
                 return 0, None
 
+            if image is None:
+                return 0, None
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+            # With OpenCL the frame is uploaded once and eye ROIs are views into it
+            gray_src = cv2.UMat(gray) if self.use_opencl else gray
+
             faces = self.face_cascade.detectMultiScale(
-                gray,
+                gray_src,
                 scaleFactor=1.1,
                 minNeighbors=5,
                 minSize=(30, 30)
@@ -81,7 +257,10 @@ class VisionSystem:
 
             for (x, y, w, h) in faces:
                 cv2.rectangle(image, (x, y), (x + w, y + h), (255, 0, 0), 2)
-                roi_gray = gray[y:y + h, x:x + w]
+                if self.use_opencl:
+                    roi_gray = cv2.UMat(gray_src, (int(y), int(y + h)), (int(x), int(x + w)))
+                else:
+                    roi_gray = gray[y:y + h, x:x + w]
                 eyes = self.eye_cascade.detectMultiScale(roi_gray)
                 for (ex, ey, ew, eh) in eyes:
                     cv2.rectangle(image, (x + ex, y + ey),
@@ -104,11 +283,11 @@ class VisionSystem:
             Path to saved image or None
         """
         try:
-            cap = cv2.VideoCapture(self.camera_index)
-            ret, frame = cap.read()
-            cap.release()
+            import cv2
 
-            if not ret:
+            frame = self._get_latest_frame()
+
+            if frame is None:
                 print("Failed to capture image")
                 return None
 
@@ -118,7 +297,7 @@ class VisionSystem:
                 filename = f"capture_{timestamp}.jpg"
 
             save_path = os.path.join(os.path.expanduser("~"), "Pictures", filename)
-            cv2.imwrite(save_path, frame)
+            cv2.imwrite(save_path, frame, image_write_params(save_path))
             return save_path
 
         except Exception as e:
@@ -137,13 +316,24 @@ class VisionSystem:
             Extracted text or None
         """
         try:
+            import cv2
+
             if self.ocr_reader is None:
                 import easyocr
-                self.ocr_reader = easyocr.Reader(languages)
+                import torch
+                self.ocr_reader = easyocr.Reader(languages, gpu=torch.cuda.is_available())
+
+            image = cv2.imread(image_path)
+            if image is None:
+                return None
 
-            result = self.ocr_reader.readtext(image_path)
+            # Detector cost scales with pixel count; text stays legible at this size
+            scale = OCR_MAX_EDGE / max(image.shape[:2])
+            if scale < 1:
+                image = cv2.resize(image, None, fx=scale, fy=scale,
+                                   interpolation=cv2.INTER_AREA)
 
-            text_results = [detection[1] for detection in result]
+            text_results = self.ocr_reader.readtext(image, detail=0)
             extracted_text = ' '.join(text_results)
 
             return extracted_text if extracted_text else None
@@ -165,34 +355,23 @@ class VisionSystem:
             List of detected objects/colors
         """
         try:
+            import cv2
+            from .color_count import COLOR_NAMES, COLOR_MIN_PIXELS, count_colors
+
             if use_camera:
-                cap = cv2.VideoCapture(self.camera_index)
-                ret, frame = cap.read()
-                cap.release()
-                if not ret:
+                image = self._get_latest_frame()
+                if image is None:
                     return []
-                image = frame
             elif image_path:
                 image = cv2.imread(image_path)
             else:
                 return []
 
             hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+            counts = count_colors(hsv)
 
-            color_ranges = {
-                'red': ([0, 100, 100], [10, 255, 255]),
-                'blue': ([100, 100, 100], [130, 255, 255]),
-                'green': ([40, 100, 100], [80, 255, 255]),
-                'yellow': ([20, 100, 100], [40, 255, 255]),
-            }
-
-            detected_colors = []
-            for color, (lower, upper) in color_ranges.items():
-                mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-                if cv2.countNonZero(mask) > 1000:
-                    detected_colors.append(color)
-
-            return detected_colors
+            return [color for color, count in zip(COLOR_NAMES, counts)
+                    if count > COLOR_MIN_PIXELS]
 
         except Exception as e:
             print(f"Error detecting objects: {e}")
@@ -206,15 +385,15 @@ class VisionSystem:
             duration: Duration in seconds (0 for indefinite)
         """
         try:
-            cap = cv2.VideoCapture(self.camera_index)
+            import cv2
+
             print("Press 'q' to exit camera preview")
 
-            import time
             start_time = time.time()
 
             while True:
-                ret, frame = cap.read()
-                if not ret:
+                frame = self._get_latest_frame()
+                if frame is None:
                     break
 
                 cv2.imshow('JARVIS Camera', frame)
@@ -225,11 +404,33 @@ class VisionSystem:
                 if duration > 0 and (time.time() - start_time) > duration:
                     break
 
-            cap.release()
             cv2.destroyAllWindows()
 
         except Exception as e:
             print(f"Error in camera preview: {e}")
 
 
-vision_system = VisionSystem()
+_vision_system = None
+
+
+def get_vision_system() -> VisionSystem:
+    """
+    Get the shared vision system, creating it on first use
+
+    Returns:
+        VisionSystem instance
+    """
+    global _vision_system
+
+    if _vision_system is None:
+        _vision_system = VisionSystem()
+
+    return _vision_system
+
+
+def close_vision_system() -> None:
+    """
+    Release the shared vision system's camera if it was ever created
+    """
+    if _vision_system is not None:
+        _vision_system.close_camera()
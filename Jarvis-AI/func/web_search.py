@@ -3,12 +3,34 @@ Web Search Module
 Handles web searches using various search engines
 """
 
+import asyncio
+import functools
+import re
+import threading
 import webbrowser
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 import urllib.parse
 
+if TYPE_CHECKING:
+    import httpx
+
+
+WIKIPEDIA_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_query(query: str) -> str:
+    """
+    Percent-encode a query for use in a URL, caching repeated queries
+
+    Args:
+        query: Query text
+
+    Returns:
+        Encoded query
+    """
+    return urllib.parse.quote_from_bytes(query.encode('utf-8'), safe='')
+
 
 class WebSearcher:
     """
@@ -22,6 +44,103 @@ class WebSearcher:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        self._client = None
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the background event loop that owns the HTTP client
+
+        The loop lives for the whole process so pooled connections can be
+        reused by every sync and async call.
+
+        Returns:
+            Running event loop
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._run_loop, args=(self._loop,))
+                thread.daemon = True
+                thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Run the loop until it is stopped, then close it
+
+        Args:
+            loop: Event loop owned by this thread
+        """
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _run(self, coro):
+        """
+        Run a coroutine on the background loop and wait for its result
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared HTTP/2 client, creating it on first use
+
+        Returns:
+            Async HTTP client
+        """
+        if self._client is None:
+            import httpx
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=4)
+            )
+            self._client = httpx.AsyncClient(
+                headers={**self.headers, 'Accept-Encoding': 'gzip, br'},
+                timeout=httpx.Timeout(10.0, connect=1.0),
+                transport=transport,
+                follow_redirects=True
+            )
+        return self._client
+
+    async def _shutdown(self) -> None:
+        """
+        Cancel in-flight requests and close the HTTP client
+        """
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def close(self) -> None:
+        """
+        Close the HTTP client and stop the background loop
+
+        In-flight requests are cancelled first so no caller thread is left
+        waiting on a loop that has stopped.
+        """
+        if self._loop is None:
+            return
+
+        self._run(self._shutdown())
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
 
     def search_google(self, query: str, open_browser: bool = True) -> bool:
         """
@@ -35,7 +154,7 @@ class WebSearcher:
             True if successful
         """
         try:
-            url = f"https://www.google.com/search?q={urllib.parse.quote(query)}"
+            url = f"https://www.google.com/search?q={_encode_query(query)}"
             if open_browser:
                 webbrowser.open(url)
             return True
@@ -55,7 +174,7 @@ class WebSearcher:
             True if successful
         """
         try:
-            url = f"https://www.bing.com/search?q={urllib.parse.quote(query)}"
+            url = f"https://www.bing.com/search?q={_encode_query(query)}"
             if open_browser:
                 webbrowser.open(url)
             return True
@@ -75,7 +194,7 @@ class WebSearcher:
             True if successful
         """
         try:
-            url = f"https://duckduckgo.com/?q={urllib.parse.quote(query)}"
+            url = f"https://duckduckgo.com/?q={_encode_query(query)}"
             if open_browser:
                 webbrowser.open(url)
             return True
@@ -95,7 +214,7 @@ class WebSearcher:
             True if successful
         """
         try:
-            url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(query)}"
+            url = f"https://www.youtube.com/results?search_query={_encode_query(query)}"
             if open_browser:
                 webbrowser.open(url)
             return True
@@ -107,6 +226,20 @@ class WebSearcher:
         """
         Get search results without opening browser
 
+        Args:
+            query: Search query
+            num_results: Number of results to return
+
+        Returns:
+            List of search results with title and link
+        """
+        return self._run(self.get_search_results_async(query, num_results))
+
+    async def get_search_results_async(self, query: str,
+                                       num_results: int = 5) -> List[Dict[str, str]]:
+        """
+        Get search results without opening browser (async)
+
         Args:
             query: Search query
             num_results: Number of results to return
@@ -116,27 +249,65 @@ class WebSearcher:
         """
         results = []
         try:
-            url = f"https://www.google.com/search?q={urllib.parse.quote(query)}"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = f"https://www.google.com/search?q={_encode_query(query)}"
+            response = await self._get_client().get(url)
+            results = self._parse_search_results(response.content, num_results)
+        except Exception as e:
+            print(f"Error getting search results: {e}")
 
-            search_results = soup.find_all('div', class_='g')
+        return results
 
-            for result in search_results[:num_results]:
-                title_elem = result.find('h3')
-                link_elem = result.find('a')
+    def _parse_search_results(self, content: bytes, num_results: int) -> List[Dict[str, str]]:
+        """
+        Extract result titles and links from a Google results page
 
-                if title_elem and link_elem:
-                    title = title_elem.get_text()
-                    link = link_elem.get('href')
-                    if link and link.startswith('http'):
-                        results.append({
-                            'title': title,
-                            'link': link
-                        })
+        Uses selectolax when installed, otherwise BeautifulSoup.
 
-        except Exception as e:
-            print(f"Error getting search results: {e}")
+        Args:
+            content: Raw HTML of the results page
+            num_results: Number of results to return
+
+        Returns:
+            List of search results with title and link
+        """
+        results = []
+
+        try:
+            from selectolax.parser import HTMLParser
+        except ImportError:
+            HTMLParser = None
+
+        if HTMLParser is not None:
+            tree = HTMLParser(content)
+            for node in tree.css('div.g')[:num_results]:
+                title_elem = node.css_first('h3')
+                link_elem = node.css_first('a')
+                if title_elem is None or link_elem is None:
+                    continue
+
+                link = link_elem.attributes.get('href')
+                if link and link.startswith('http'):
+                    results.append({
+                        'title': title_elem.text(),
+                        'link': link
+                    })
+            return results
+
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content, 'html.parser')
+
+        for result in soup.find_all('div', class_='g')[:num_results]:
+            title_elem = result.find('h3')
+            link_elem = result.find('a')
+
+            if title_elem and link_elem:
+                title = title_elem.get_text()
+                link = link_elem.get('href')
+                if link and link.startswith('http'):
+                    results.append({
+                        'title': title,
+                        'link': link
+                    })
 
         return results
 
@@ -144,6 +315,18 @@ class WebSearcher:
         """
         Search Wikipedia and get summary
 
+        Args:
+            query: Search query
+
+        Returns:
+            Wikipedia summary or None
+        """
+        return self._run(self.search_wikipedia_async(query))
+
+    async def search_wikipedia_async(self, query: str) -> Optional[str]:
+        """
+        Get a Wikipedia summary from the REST API (async)
+
         Args:
             query: Search query
 
@@ -151,16 +334,62 @@ class WebSearcher:
             Wikipedia summary or None
         """
         try:
-            import wikipedia
-            summary = wikipedia.summary(query, sentences=3)
-            return summary
-        except wikipedia.exceptions.DisambiguationError as e:
-            return f"Multiple results found. Please be more specific. Options: {', '.join(e.options[:5])}"
-        except wikipedia.exceptions.PageError:
-            return "No Wikipedia page found for this query."
+            title = _encode_query(query.strip().replace(' ', '_'))
+            response = await self._get_client().get(WIKIPEDIA_SUMMARY_URL.format(title=title))
+
+            if response.status_code == 404:
+                return "No Wikipedia page found for this query."
+            response.raise_for_status()
+
+            data = response.json()
+            if data.get('type') == 'disambiguation':
+                return "Multiple results found. Please be more specific."
+
+            sentences = re.split(r'(?<=[.!?])\s+', data.get('extract', '').strip())
+            summary = ' '.join(sentences[:3])
+            return summary if summary else None
         except Exception as e:
             print(f"Error searching Wikipedia: {e}")
             return None
 
+    async def fetch_all(self, query: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+        """
+        Fetch search results and Wikipedia summary concurrently
+
+        Args:
+            query: Search query
+
+        Returns:
+            Tuple of (search results, Wikipedia summary)
+        """
+        results, summary = await asyncio.gather(
+            self.get_search_results_async(query),
+            self.search_wikipedia_async(query)
+        )
+        return results, summary
+
+
+_web_searcher = None
+
 
-web_searcher = WebSearcher()
+def get_web_searcher() -> WebSearcher:
+    """
+    Get the shared web searcher, creating it on first use
+
+    Returns:
+        WebSearcher instance
+    """
+    global _web_searcher
+
+    if _web_searcher is None:
+        _web_searcher = WebSearcher()
+
+    return _web_searcher
+
+
+def close_web_searcher() -> None:
+    """
+    Close the shared web searcher's client and event loop if it was ever created
+    """
+    if _web_searcher is not None:
+        _web_searcher.close()
@@ -3,15 +3,174 @@ JARVIS Core Module
 Main logic and command routing for the AI assistant
 """
 
+import asyncio
 import json
 import os
+import queue
+import random
 import re
-from typing import Optional, Dict, Any, Callable
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, fields
+from typing import (Optional, Dict, Callable, Iterable, Iterator, List, Tuple,
+                    AsyncIterator)
+from cachetools import TTLCache
 from func.basic.listen import VoiceListener
 from func.basic.speak import VoiceSpeaker
-from func.basic.tasks import task_automation
-from func.basic.web_search import web_searcher
-from func.basic.vision import vision_system
+from func.basic.tasks import get_task_automation
+from func.basic.web_search import get_web_searcher, close_web_searcher
+from func.basic.vision import get_vision_system, close_vision_system
+from func.basic.semantic_cache import SemanticCache
+
+
+# OpenAI is hedged in once Gemini's first token is later than its usual p95
+AI_HEDGE_DELAY = 1.5
+AI_HEDGE_MIN_DELAY = 1.0
+AI_HEDGE_PERCENTILE = 0.95
+AI_HEDGE_SAMPLES = 50
+AI_HEDGE_MIN_SAMPLES = 10
+AI_RESPONSE_TIMEOUT = 15
+# Providers waiting on the network after losing a race still hold a worker
+AI_POOL_WORKERS = 4
+_STREAM_DONE = object()
+AI_FALLBACK_RESPONSE = ("I'm not sure how to help with that. "
+                        "Try asking me to search, open apps, or perform tasks.")
+GREETINGS = (
+    "Hello! How can I help you today?",
+    "Hi there! What can I do for you?",
+    "Hey! I'm here to assist you.",
+    "Greetings! How may I be of service?",
+)
+URL_RE = re.compile(r'\bwww\b|\.(?:com|org|net|io|dev|gov|edu|co\.uk)\b', re.IGNORECASE)
+# Handlers whose query is likely to be followed by "wikipedia <query>",
+# with the match group that holds the query
+PREFETCH_QUERY_GROUPS = {
+    'handle_search': 1,
+    'handle_search_on': 1,
+    'handle_search_engine': 2,
+    'handle_youtube': 1,
+}
+
+LOOKUP_CACHE_SIZE = 256
+LOOKUP_CACHE_TTL = 600
+PREFETCH_WAIT_TIMEOUT = 3
+STREAM_CHUNK_CHARS = 80
+SENTENCE_END_RE = re.compile(r'[.!?]\s')
+
+COMMAND_PATTERNS = (
+    (r'(what|tell).*time', 'handle_time'),
+    (r'(what|tell).*date', 'handle_date'),
+    (r'screenshot', 'handle_screenshot'),
+    (r'open\s+(.+)', 'handle_open'),
+    (r'search\s+(.+)\s+on\s+(\S+)$', 'handle_search_on'),
+    (r'search\s+(.+)', 'handle_search'),
+    (r'(google|bing|duckduckgo) (.+)', 'handle_search_engine'),
+    (r'youtube\s+(.+)', 'handle_youtube'),
+    (r'wikipedia\s+(.+)', 'handle_wikipedia'),
+    (r'system (info|status)', 'handle_system_info'),
+    (r'take (photo|picture)', 'handle_take_photo'),
+    (r'detect face', 'handle_detect_faces'),
+    (r'read text', 'handle_ocr'),
+    (r'(volume|sound) (up|down|mute)', 'handle_volume'),
+    (r'close (.+)', 'handle_close_app'),
+    (r'(exit|quit|goodbye|bye)', 'handle_exit'),
+    (r'(hello|hi|hey)', 'handle_greeting'),
+)
+
+# Leading words that identify a command outright, with the handlers to try in order
+COMMAND_VERBS = {
+    'open': ('handle_open',),
+    'search': ('handle_search_on', 'handle_search'),
+    'google': ('handle_search_engine',),
+    'bing': ('handle_search_engine',),
+    'duckduckgo': ('handle_search_engine',),
+    'youtube': ('handle_youtube',),
+    'wikipedia': ('handle_wikipedia',),
+    'screenshot': ('handle_screenshot',),
+    'close': ('handle_close_app',),
+    'volume': ('handle_volume',),
+    'sound': ('handle_volume',),
+    'exit': ('handle_exit',),
+    'quit': ('handle_exit',),
+}
+
+
+@dataclass(frozen=True)
+class JarvisConfig:
+    """
+    Settings loaded from config.json
+    """
+    language: str = "en-US"
+    wake_word: str = "jarvis"
+    voice_rate: int = 150
+    voice_volume: float = 0.9
+    gemini_api: str = ""
+    openai_api: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, 'wake_word', self.wake_word.lower())
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'JarvisConfig':
+        """
+        Build config from parsed JSON, ignoring unknown keys
+
+        Args:
+            data: Configuration dictionary (API keys may be upper-case)
+
+        Returns:
+            JarvisConfig instance
+        """
+        names = {field.name for field in fields(cls)}
+        return cls(**{key.lower(): value for key, value in data.items()
+                      if key.lower() in names})
+
+
+def _chunk_sentences(tokens: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup streamed tokens into sentence-sized chunks for speech
+
+    A chunk ends at sentence punctuation followed by whitespace, or at the
+    last word break once it grows past STREAM_CHUNK_CHARS.
+
+    Args:
+        tokens: Text fragments in arrival order
+
+    Returns:
+        Iterator of non-empty text chunks
+    """
+    buffer = ''
+    try:
+        for token in tokens:
+            if not token:
+                continue
+            buffer += token
+
+            while True:
+                end = SENTENCE_END_RE.search(buffer)
+                if end:
+                    cut = end.start() + 1
+                elif len(buffer) > STREAM_CHUNK_CHARS and ' ' in buffer:
+                    cut = buffer.rindex(' ')
+                else:
+                    break
+
+                chunk = buffer[:cut].strip()
+                buffer = buffer[cut:].lstrip()
+                if chunk:
+                    yield chunk
+    except Exception:
+        # Speak what already arrived before the stream failed
+        buffer = buffer.strip()
+        if buffer:
+            yield buffer
+        raise
+
+    buffer = buffer.strip()
+    if buffer:
+        yield buffer
 
 
 class JarvisCore:
@@ -28,23 +187,38 @@ class JarvisCore:
             config_path: Path to configuration file
         """
         self.config = self._load_config(config_path)
-        self.listener = VoiceListener(language=self.config.get('language', 'en-US'))
+        self.listener = VoiceListener(language=self.config.language)
         self.speaker = VoiceSpeaker(
-            rate=self.config.get('voice_rate', 150),
-            volume=self.config.get('voice_volume', 0.9)
+            rate=self.config.voice_rate,
+            volume=self.config.voice_volume
         )
 
-        self.wake_word = self.config.get('wake_word', 'jarvis').lower()
+        self.wake_word = self.config.wake_word
+        self.wake_automaton = self._build_wake_automaton()
         self.is_active = False
         self.conversation_mode = False
 
+        self.greetings = deque(GREETINGS)
+        random.shuffle(self.greetings)
+
+        self.gemini_api = self.config.gemini_api
+        self.openai_api = self.config.openai_api
         self.gemini_client = None
         self.openai_client = None
-        self._init_ai_clients()
+        self.http_client = None
+        self._llm_pool = ThreadPoolExecutor(max_workers=AI_POOL_WORKERS)
+        self._first_token_times = deque(maxlen=AI_HEDGE_SAMPLES)
+        self._first_token_lock = threading.Lock()
+        self.response_cache = SemanticCache()
+        self.wikipedia_cache = TTLCache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_CACHE_TTL)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self.pending_prefetches = {}
 
         self.command_handlers = self._register_commands()
+        self.command_set = self._build_command_set()
+        self.verb_table = self._build_verb_table()
 
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
+    def _load_config(self, config_path: str) -> JarvisConfig:
         """
         Load configuration from JSON file
 
@@ -52,68 +226,209 @@ class JarvisCore:
             config_path: Path to config file
 
         Returns:
-            Configuration dictionary
+            Configuration object
         """
         try:
             if not os.path.exists(config_path):
                 config_path = os.path.join(os.path.dirname(__file__), config_path)
 
             with open(config_path, 'r') as f:
-                return json.load(f)
+                return JarvisConfig.from_dict(json.load(f))
         except Exception as e:
             print(f"Error loading config: {e}")
-            return {}
+            return JarvisConfig()
+
+    def _build_wake_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the wake word
+
+        Returns:
+            ahocorasick.Automaton or None if pyahocorasick is not installed
+        """
+        try:
+            import ahocorasick
+        except ImportError:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        automaton.add_word(self.wake_word, len(self.wake_word))
+        automaton.make_automaton()
+        return automaton
+
+    def _strip_wake_word(self, command: str) -> Optional[str]:
+        """
+        Locate the wake word and cut it out of the utterance in one scan
+
+        Args:
+            command: Recognized text
 
-    def _init_ai_clients(self) -> None:
+        Returns:
+            Text without the wake word, or None if it was not spoken
         """
-        Initialize AI API clients (Gemini/OpenAI)
+        if self.wake_automaton is not None:
+            for end, length in self.wake_automaton.iter(command):
+                start = end + 1 - length
+                break
+            else:
+                return None
+        else:
+            start = command.find(self.wake_word)
+            if start < 0:
+                return None
+            length = len(self.wake_word)
+
+        return (command[:start] + command[start + length:]).strip()
+
+    def _get_gemini_client(self):
         """
-        gemini_api = self.config.get('GEMINI_API')
-        if gemini_api:
+        Get the Gemini client, importing the SDK on first use
+
+        Returns:
+            Gemini model or None if not configured
+        """
+        if self.gemini_client is None and self.gemini_api:
             try:
                 import google.generativeai as genai
-                genai.configure(api_key=gemini_api)
+                genai.configure(api_key=self.gemini_api)
                 self.gemini_client = genai.GenerativeModel('gemini-pro')
                 print("Gemini AI initialized")
             except Exception as e:
                 print(f"Error initializing Gemini: {e}")
+                self.gemini_api = None
+
+        return self.gemini_client
+
+    def _get_openai_client(self):
+        """
+        Get the OpenAI client, importing the SDK on first use
+
+        The client runs over a shared keep-alive HTTP/2 connection pool so
+        repeated questions skip the TCP and TLS handshakes.
 
-        openai_api = self.config.get('OPENAI_API')
-        if openai_api:
+        Returns:
+            OpenAI client or None if not configured
+        """
+        if self.openai_client is None and self.openai_api:
             try:
-                import openai
-                openai.api_key = openai_api
-                self.openai_client = openai
+                import httpx
+                from openai import OpenAI
+                self.http_client = httpx.Client(
+                    http2=True,
+                    timeout=10.0,
+                    limits=httpx.Limits(keepalive_expiry=60)
+                )
+                self.openai_client = OpenAI(api_key=self.openai_api, http_client=self.http_client)
                 print("OpenAI initialized")
             except Exception as e:
                 print(f"Error initializing OpenAI: {e}")
+                self.openai_api = None
+
+        return self.openai_client
+
+    def close_ai_clients(self) -> None:
+        """
+        Close the shared HTTP connection pool used by the AI clients
+        """
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
+            self.openai_client = None
 
-    def _register_commands(self) -> Dict[str, Callable]:
+    def close_worker_pools(self) -> None:
+        """
+        Cancel pending background work and release the worker threads
+
+        Executors only start threads once work is submitted, so fresh ones
+        keep the assistant usable if listening is started again.
+        """
+        for prefetch in self.pending_prefetches.values():
+            prefetch.cancel()
+        self.pending_prefetches = {}
+
+        self._llm_pool.shutdown(wait=False)
+        self._prefetch_pool.shutdown(wait=False)
+        self._llm_pool = ThreadPoolExecutor(max_workers=AI_POOL_WORKERS)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+
+    def _register_commands(self) -> List[Tuple[re.Pattern, Callable]]:
         """
         Register command handlers
 
         Returns:
-            Dictionary of command patterns to handler functions
-        """
-        return {
-            r'(what|tell).*time': self.handle_time,
-            r'(what|tell).*date': self.handle_date,
-            r'screenshot': self.handle_screenshot,
-            r'open (.+)': self.handle_open,
-            r'search (.+) on (.+)': self.handle_search_on,
-            r'search (.+)': self.handle_search,
-            r'(google|bing|duckduckgo) (.+)': self.handle_search_engine,
-            r'youtube (.+)': self.handle_youtube,
-            r'wikipedia (.+)': self.handle_wikipedia,
-            r'system (info|status)': self.handle_system_info,
-            r'take (photo|picture)': self.handle_take_photo,
-            r'detect face': self.handle_detect_faces,
-            r'read text': self.handle_ocr,
-            r'(volume|sound) (up|down|mute)': self.handle_volume,
-            r'close (.+)': self.handle_close_app,
-            r'(exit|quit|goodbye|bye)': self.handle_exit,
-            r'(hello|hi|hey)': self.handle_greeting,
-        }
+            List of compiled command patterns and their handler functions
+        """
+        return [(re.compile(pattern, re.IGNORECASE), getattr(self, handler))
+                for pattern, handler in COMMAND_PATTERNS]
+
+    def _build_verb_table(self) -> Dict[str, List[Tuple[re.Pattern, Callable]]]:
+        """
+        Map leading command words to the patterns that can match them
+
+        Returns:
+            Dictionary of first word to (pattern, handler) candidates
+        """
+        by_name = {name: entry for (_, name), entry
+                   in zip(COMMAND_PATTERNS, self.command_handlers)}
+        return {verb: [by_name[name] for name in names]
+                for verb, names in COMMAND_VERBS.items()}
+
+    def _build_command_set(self):
+        """
+        Compile all command patterns into a single RE2 set
+
+        Returns:
+            Compiled re2.Set or None if google-re2 is not installed
+        """
+        try:
+            import re2
+        except ImportError:
+            return None
+
+        try:
+            options = re2.Options()
+            options.case_sensitive = False
+            command_set = re2.Set.SearchSet(options)
+            for pattern, _ in COMMAND_PATTERNS:
+                command_set.Add(pattern)
+            command_set.Compile()
+            return command_set
+        except Exception as e:
+            print(f"Error building RE2 command set: {e}")
+            return None
+
+    def _match_command(self, command: str) -> Tuple[Optional[Callable], Optional[re.Match]]:
+        """
+        Find the first registered command matching the text
+
+        Commands starting with a known verb only try that verb's patterns,
+        anchored at the start of the text since every one of them begins
+        with the verb. Otherwise, with RE2 available, one scan finds every matching pattern
+        and only the winning pattern is re-run to extract its groups.
+
+        Args:
+            command: Voice command text
+
+        Returns:
+            Tuple of (handler, match) or (None, None)
+        """
+        for pattern, handler in self.verb_table.get(command.partition(' ')[0], ()):
+            match = pattern.match(command)
+            if match:
+                return handler, match
+
+        if self.command_set is not None:
+            ids = self.command_set.Match(command)
+            if not ids:
+                return None, None
+            pattern, handler = self.command_handlers[min(ids)]
+            return handler, pattern.search(command)
+
+        for pattern, handler in self.command_handlers:
+            match = pattern.search(command)
+            if match:
+                return handler, match
+
+        return None, None
 
     def speak(self, text: str, async_mode: bool = False) -> None:
         """
@@ -137,6 +452,70 @@ class JarvisCore:
         """
         return self.listener.listen(timeout=timeout)
 
+    def accept_command(self, command: str, heard_while_speaking: bool,
+                       require_wake_word: bool = True) -> Optional[str]:
+        """
+        Decide whether an utterance is meant for JARVIS
+
+        While a response is playing the microphone also picks up JARVIS's
+        own voice, so utterances heard then only count when they contain
+        the wake word. Such an utterance is a barge-in and cuts the
+        response off.
+
+        Args:
+            command: Recognized text
+            heard_while_speaking: Whether a response was playing during capture
+            require_wake_word: Whether the wake word is needed when silent
+
+        Returns:
+            Command text without the wake word, or None to ignore it
+        """
+        stripped = self._strip_wake_word(command)
+        if stripped is None:
+            if require_wake_word or heard_while_speaking:
+                return None
+            stripped = command.strip()
+
+        if heard_while_speaking and self.speaker.speaking.is_set():
+            self.speaker.stop()
+
+        return stripped
+
+    async def alisten(self, timeout: int = 5) -> Optional[str]:
+        """
+        Listen for voice input without blocking the event loop
+
+        Args:
+            timeout: Maximum wait time
+
+        Returns:
+            Recognized text or None
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.listen, timeout)
+
+    async def aprocess_stream(self, command: str) -> AsyncIterator[str]:
+        """
+        Process voice command without blocking the event loop
+
+        Each chunk of process_command_stream is produced on an executor
+        thread, so network calls for the next chunk overlap with whatever
+        the loop does with the previous one.
+
+        Args:
+            command: Voice command text
+
+        Returns:
+            Async iterator of response chunks
+        """
+        loop = asyncio.get_running_loop()
+        chunks = self.process_command_stream(command)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
     def process_command(self, command: str) -> str:
         """
         Process voice command and execute appropriate action
@@ -149,64 +528,114 @@ class JarvisCore:
         """
         command = command.lower().strip()
 
-        for pattern, handler in self.command_handlers.items():
-            match = re.search(pattern, command)
-            if match:
-                try:
-                    return handler(command, match)
-                except Exception as e:
-                    return f"Error processing command: {str(e)}"
+        handler, match = self._match_command(command)
+        if handler:
+            try:
+                response = handler(command, match)
+            except Exception as e:
+                return f"Error processing command: {str(e)}"
+            self._prefetch_followup(handler, match)
+            return response
 
         return self.handle_ai_conversation(command)
 
+    def process_command_stream(self, command: str) -> Iterator[str]:
+        """
+        Process voice command, yielding the response in speakable chunks
+
+        Command handlers yield their whole response at once; AI answers are
+        streamed sentence by sentence as the model generates them.
+
+        Args:
+            command: Voice command text
+
+        Returns:
+            Iterator of response chunks
+        """
+        command = command.lower().strip()
+
+        handler, match = self._match_command(command)
+        if handler:
+            try:
+                response = handler(command, match)
+            except Exception as e:
+                yield f"Error processing command: {str(e)}"
+                return
+            self._prefetch_followup(handler, match)
+            yield response
+            return
+
+        yield from self.stream_ai_conversation(command)
+
+    def _prefetch_followup(self, handler: Callable, match: re.Match) -> None:
+        """
+        Start fetching data the next command is likely to ask for
+
+        After a web search the Wikipedia summary for the same query is
+        fetched in the background while the response is being spoken.
+
+        Args:
+            handler: Handler that just ran
+            match: Match object the handler received
+        """
+        group = PREFETCH_QUERY_GROUPS.get(handler.__name__)
+        if group is None:
+            return
+
+        query = match.group(group).strip()
+        if query in self.wikipedia_cache:
+            return
+
+        # Only the most recent command's follow-up is worth keeping
+        self.pending_prefetches = {
+            query: self._prefetch_pool.submit(get_web_searcher().search_wikipedia, query)
+        }
+
     def handle_time(self, command: str, match: re.Match) -> str:
         """Handle time query"""
-        current_time = task_automation.get_time()
+        current_time = get_task_automation().get_time()
         return f"The current time is {current_time}"
 
     def handle_date(self, command: str, match: re.Match) -> str:
         """Handle date query"""
-        current_date = task_automation.get_date()
+        current_date = get_task_automation().get_date()
         return f"Today is {current_date}"
 
     def handle_screenshot(self, command: str, match: re.Match) -> str:
         """Handle screenshot command"""
-        path = task_automation.take_screenshot()
-        return f"Screenshot saved to {path}"
+        path = get_task_automation().take_screenshot()
+        return f"Screenshot saved to {path}" if path else "Failed to take screenshot"
 
     def handle_open(self, command: str, match: re.Match) -> str:
         """Handle open application command"""
-        app_name = command.replace('open', '').strip()
+        app_name = match.group(1).strip()
 
-        if any(domain in app_name for domain in ['.com', '.org', '.net', 'www']):
-            success = task_automation.open_website(app_name)
+        if URL_RE.search(app_name):
+            success = get_task_automation().open_website(app_name)
             return f"Opening {app_name}" if success else f"Failed to open {app_name}"
         else:
-            success = task_automation.open_application(app_name)
+            success = get_task_automation().open_application(app_name)
             return f"Opening {app_name}" if success else f"Failed to open {app_name}"
 
     def handle_search(self, command: str, match: re.Match) -> str:
         """Handle general search command"""
-        query = command.replace('search', '').strip()
-        web_searcher.search_google(query)
+        query = match.group(1).strip()
+        get_web_searcher().search_google(query)
         return f"Searching for {query}"
 
     def handle_search_on(self, command: str, match: re.Match) -> str:
         """Handle search on specific engine"""
-        parts = command.split(' on ')
-        if len(parts) == 2:
-            query = parts[0].replace('search', '').strip()
-            engine = parts[1].strip()
+        query = match.group(1).strip()
+        engine = match.group(2)
 
-            if 'google' in engine:
-                web_searcher.search_google(query)
-            elif 'bing' in engine:
-                web_searcher.search_bing(query)
-            elif 'duckduckgo' in engine:
-                web_searcher.search_duckduckgo(query)
+        if 'google' in engine:
+            get_web_searcher().search_google(query)
+        elif 'bing' in engine:
+            get_web_searcher().search_bing(query)
+        elif 'duckduckgo' in engine:
+            get_web_searcher().search_duckduckgo(query)
 
-            return f"Searching {query} on {engine}"
-        return "Could not understand search command"
+        return f"Searching {query} on {engine}"
 
     def handle_search_engine(self, command: str, match: re.Match) -> str:
         """Handle search engine specific command"""
@@ -214,29 +643,41 @@ class JarvisCore:
         query = match.group(2)
 
         if engine == 'google':
-            web_searcher.search_google(query)
+            get_web_searcher().search_google(query)
         elif engine == 'bing':
-            web_searcher.search_bing(query)
+            get_web_searcher().search_bing(query)
         elif engine == 'duckduckgo':
-            web_searcher.search_duckduckgo(query)
+            get_web_searcher().search_duckduckgo(query)
 
         return f"Searching {query} on {engine}"
 
     def handle_youtube(self, command: str, match: re.Match) -> str:
         """Handle YouTube search"""
-        query = command.replace('youtube', '').strip()
-        web_searcher.search_youtube(query)
+        query = match.group(1).strip()
+        get_web_searcher().search_youtube(query)
         return f"Searching YouTube for {query}"
 
     def handle_wikipedia(self, command: str, match: re.Match) -> str:
         """Handle Wikipedia search"""
-        query = command.replace('wikipedia', '').strip()
-        result = web_searcher.search_wikipedia(query)
+        query = match.group(1).strip()
+        result = self.wikipedia_cache.get(query)
+        if result is None:
+            prefetch = self.pending_prefetches.pop(query, None)
+            if prefetch is not None:
+                try:
+                    result = prefetch.result(timeout=PREFETCH_WAIT_TIMEOUT)
+                except FutureTimeoutError:
+                    # Don't let a stuck prefetch hold up the command
+                    prefetch = None
+            if prefetch is None:
+                result = get_web_searcher().search_wikipedia(query)
+            if result:
+                self.wikipedia_cache[query] = result
         return result if result else "Could not find information on Wikipedia"
 
     def handle_system_info(self, command: str, match: re.Match) -> str:
         """Handle system info query"""
-        info = task_automation.get_system_info()
+        info = get_task_automation().get_system_info()
         response = f"System: {info.get('system', 'Unknown')}, "
         response += f"CPU usage: {info.get('cpu_usage', 'N/A')}, "
         response += f"Memory usage: {info.get('memory_usage', 'N/A')}"
@@ -244,51 +685,50 @@ class JarvisCore:
 
     def handle_take_photo(self, command: str, match: re.Match) -> str:
         """Handle take photo command"""
-        path = vision_system.capture_photo()
+        path = get_vision_system().capture_photo()
         return f"Photo captured and saved to {path}" if path else "Failed to capture photo"
 
     def handle_detect_faces(self, command: str, match: re.Match) -> str:
         """Handle face detection command"""
-        count, _ = vision_system.detect_faces(use_camera=True)
+        count, _ = get_vision_system().detect_faces(use_camera=True)
         if count > 0:
             return f"I detected {count} face{'s' if count > 1 else ''}"
         return "No faces detected"
 
     def handle_ocr(self, command: str, match: re.Match) -> str:
         """Handle OCR command"""
-        photo_path = vision_system.capture_photo()
+        photo_path = get_vision_system().capture_photo()
         if photo_path:
-            text = vision_system.perform_ocr(photo_path)
+            text = get_vision_system().perform_ocr(photo_path)
             return f"I found this text: {text}" if text else "No text found in image"
         return "Failed to capture image for OCR"
 
     def handle_volume(self, command: str, match: re.Match) -> str:
         """Handle volume control"""
         action = match.group(2)
-        success = task_automation.volume_control(action)
+        success = get_task_automation().volume_control(action)
         return f"Volume {action}" if success else "Failed to control volume"
 
     def handle_close_app(self, command: str, match: re.Match) -> str:
         """Handle close application command"""
         app_name = match.group(1)
-        success = task_automation.close_application(app_name)
+        success = get_task_automation().close_application(app_name)
         return f"Closing {app_name}" if success else f"Could not close {app_name}"
 
     def handle_exit(self, command: str, match: re.Match) -> str:
         """Handle exit command"""
         self.is_active = False
+        self.close_worker_pools()
+        close_web_searcher()
+        close_vision_system()
+        self.close_ai_clients()
         return "Goodbye! Have a great day."
 
     def handle_greeting(self, command: str, match: re.Match) -> str:
         """Handle greeting"""
-        import random
-        greetings = [
-            "Hello! How can I help you today?",
-            "Hi there! What can I do for you?",
-            "Hey! I'm here to assist you.",
-            "Greetings! How may I be of service?"
-        ]
-        return random.choice(greetings)
+        greeting = self.greetings[0]
+        self.greetings.rotate(-1)
+        return greeting
 
     def handle_ai_conversation(self, message: str) -> str:
         """
@@ -300,24 +740,198 @@ class JarvisCore:
         Returns:
             AI response
         """
-        if self.gemini_client:
-            try:
-                response = self.gemini_client.generate_content(message)
-                return response.text
-            except Exception as e:
-                print(f"Gemini error: {e}")
+        return ' '.join(self.stream_ai_conversation(message))
 
-        if self.openai_client:
-            try:
-                response = self.openai_client.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": message}]
-                )
-                return response.choices[0].message.content
-            except Exception as e:
-                print(f"OpenAI error: {e}")
+    def stream_ai_conversation(self, message: str) -> Iterator[str]:
+        """
+        Stream an AI response, Gemini first with OpenAI hedged
+
+        Args:
+            message: User message
+
+        Returns:
+            Iterator of sentence-sized response chunks
+        """
+        cached, vector = self.response_cache.lookup(message)
+        if cached:
+            yield cached
+            return
 
-        return "I'm not sure how to help with that. Try asking me to search, open apps, or perform tasks."
+        chunks = []
+        try:
+            for chunk in _chunk_sentences(self._stream_ai_tokens(message)):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            # A reply cut off mid-stream is spoken but never cached
+            print(f"AI streaming error: {e}")
+            if chunks:
+                return
+
+        if chunks:
+            self.response_cache.store(vector, ' '.join(chunks))
+            return
+
+        yield AI_FALLBACK_RESPONSE
+
+    def _stream_ai_tokens(self, message: str) -> Iterator[str]:
+        """
+        Race the AI providers and stream text from whichever answers first
+
+        Gemini starts first. OpenAI is started as well if Gemini sends no
+        text within the hedge delay or fails before sending any. The first
+        provider to deliver text wins and the other is abandoned.
+
+        Args:
+            message: User message
+
+        Returns:
+            Iterator of text fragments
+
+        Raises:
+            TimeoutError: If no text arrives for AI_RESPONSE_TIMEOUT seconds
+            Exception: If the winning provider fails mid-stream
+        """
+        streams = (self._stream_gemini, self._stream_openai)
+        events = queue.Queue()
+        cancel = threading.Event()
+        started = 0
+        finished = 0
+        winner = None
+
+        def start_next():
+            nonlocal started
+            self._llm_pool.submit(self._pump_stream, started, streams[started],
+                                  message, events, cancel)
+            started += 1
+
+        start_next()
+        hedge_at = time.monotonic() + self._hedge_delay()
+
+        try:
+            while True:
+                hedging = winner is None and started < len(streams)
+                timeout = max(0.0, hedge_at - time.monotonic()) if hedging else AI_RESPONSE_TIMEOUT
+
+                try:
+                    index, item = events.get(timeout=timeout)
+                except queue.Empty:
+                    if hedging:
+                        start_next()
+                        continue
+                    raise TimeoutError("AI response timed out")
+
+                if winner is None:
+                    if item is _STREAM_DONE or isinstance(item, Exception):
+                        # This provider gave up without answering
+                        finished += 1
+                        if started < len(streams):
+                            start_next()
+                        elif finished == started:
+                            return
+                        continue
+                    winner = index
+
+                if index != winner:
+                    continue
+                if item is _STREAM_DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            cancel.set()
+
+    def _hedge_delay(self) -> float:
+        """
+        Get how long to wait for Gemini's first token before starting OpenAI
+
+        Returns:
+            AI_HEDGE_PERCENTILE of recent first-token times, at least
+            AI_HEDGE_MIN_DELAY (AI_HEDGE_DELAY until enough samples exist)
+        """
+        with self._first_token_lock:
+            samples = sorted(self._first_token_times)
+
+        if len(samples) < AI_HEDGE_MIN_SAMPLES:
+            return AI_HEDGE_DELAY
+
+        rank = min(len(samples) - 1, int(len(samples) * AI_HEDGE_PERCENTILE))
+        return max(AI_HEDGE_MIN_DELAY, samples[rank])
+
+    def _pump_stream(self, index: int, stream: Callable[[str], Iterator[str]],
+                     message: str, events: queue.Queue, cancel: threading.Event) -> None:
+        """
+        Forward one provider's stream into a shared event queue
+
+        Gemini's first-token time is recorded even after losing the race,
+        so the hedge delay tracks its real latency.
+
+        Args:
+            index: Provider position, used to tag events
+            stream: Provider streaming method
+            message: User message
+            events: Queue receiving (index, text / _STREAM_DONE / exception)
+            cancel: Set once the race no longer needs this provider
+        """
+        started_at = time.monotonic()
+        first = True
+        try:
+            for token in stream(message):
+                if first and token and index == 0:
+                    first = False
+                    with self._first_token_lock:
+                        self._first_token_times.append(time.monotonic() - started_at)
+                if cancel.is_set():
+                    return
+                if token:
+                    events.put((index, token))
+        except Exception as e:
+            print(f"AI streaming error: {e}")
+            events.put((index, e))
+            return
+
+        events.put((index, _STREAM_DONE))
+
+    def _stream_gemini(self, message: str) -> Iterator[str]:
+        """
+        Stream response text from Gemini
+
+        Args:
+            message: User message
+
+        Returns:
+            Iterator of text fragments, empty if Gemini is not configured
+        """
+        gemini_client = self._get_gemini_client()
+        if not gemini_client:
+            return
+
+        for chunk in gemini_client.generate_content(message, stream=True):
+            yield chunk.text
+
+    def _stream_openai(self, message: str) -> Iterator[str]:
+        """
+        Stream response text from OpenAI
+
+        Args:
+            message: User message
+
+        Returns:
+            Iterator of text fragments, empty if OpenAI is not configured
+        """
+        openai_client = self._get_openai_client()
+        if not openai_client:
+            return
+
+        response = openai_client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": message}],
+            stream=True
+        )
+        for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content
 
     def run(self) -> None:
         """
@@ -328,24 +942,29 @@ class JarvisCore:
 
         while self.is_active:
             try:
+                was_speaking = self.speaker.speaking.is_set()
                 command = self.listen(timeout=10)
 
                 if command:
-                    if not self.conversation_mode and self.wake_word not in command:
-                        continue
-
-                    command = command.replace(self.wake_word, '').strip()
+                    command = self.accept_command(
+                        command,
+                        was_speaking or self.speaker.speaking.is_set(),
+                        require_wake_word=not self.conversation_mode
+                    )
 
                     if command:
-                        response = self.process_command(command)
-                        self.speak(response)
+                        for chunk in self.process_command_stream(command):
+                            self.speak(chunk, async_mode=True)
 
             except KeyboardInterrupt:
+                self.speaker.stop()
                 self.speak("Shutting down JARVIS")
                 break
             except Exception as e:
                 print(f"Error in main loop: {e}")
 
+        self.speaker.wait_until_done()
+
 
 if __name__ == "__main__":
     jarvis = JarvisCore()
@@ -3,74 +3,142 @@ JARVIS AI Assistant - Main GUI Application
 PyQt5 GUI interface for voice assistant
 """
 
+import asyncio
 import sys
 import os
+from collections import deque
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QTextEdit, QLabel,
                              QGroupBox, QCheckBox, QMessageBox)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QIcon, QTextCursor
-import threading
+import qasync
 
 from jarvis_core import JarvisCore
+from func.basic.vision import close_vision_system
 
 
-class JarvisWorker(QThread):
+LOG_MAX_LINES = 1000
+LOG_FLUSH_INTERVAL_MS = 50
+
+
+class JarvisWorker(QObject):
     """
-    Worker thread for JARVIS operations
+    Worker task for JARVIS operations
+
+    Runs as a coroutine on the shared Qt/asyncio event loop; blocking
+    speech recognition and command processing run on executor threads.
     """
     response_signal = pyqtSignal(str)
     status_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
+    finished = pyqtSignal()
 
     def __init__(self, jarvis_core):
         super().__init__()
         self.jarvis = jarvis_core
         self.is_running = False
         self.listen_once = False
+        self._wake = asyncio.Event()
+        self._task = None
 
-    def run(self):
+    def start(self):
         """
-        Main worker thread loop
+        Schedule the worker loop on the event loop
         """
         self.is_running = True
+        self._task = asyncio.ensure_future(self.run())
 
-        while self.is_running:
-            try:
-                if self.listen_once or self.jarvis.is_active:
-                    self.status_signal.emit("Listening...")
-
-                    command = self.jarvis.listen(timeout=10)
-
-                    if command:
-                        self.response_signal.emit(f"You: {command}")
-                        self.status_signal.emit("Processing...")
+    def isRunning(self) -> bool:
+        """
+        Check whether the worker loop is still running
 
-                        response = self.jarvis.process_command(command)
+        Returns:
+            True if the worker task has not finished
+        """
+        return self._task is not None and not self._task.done()
 
-                        self.response_signal.emit(f"JARVIS: {response}")
-                        self.jarvis.speak(response)
-                        self.status_signal.emit("Ready")
+    async def run(self):
+        """
+        Main worker loop
+        """
+        try:
+            while self.is_running:
+                try:
+                    if self.listen_once or self.jarvis.is_active:
+                        self.status_signal.emit("Listening...")
+
+                        was_speaking = self.jarvis.speaker.speaking.is_set()
+                        command = await self.jarvis.alisten(timeout=10)
+
+                        # Drop JARVIS's own voice picked up during playback
+                        if command:
+                            command = self.jarvis.accept_command(
+                                command,
+                                was_speaking or self.jarvis.speaker.speaking.is_set(),
+                                require_wake_word=False
+                            )
+
+                        if command:
+                            self.response_signal.emit(f"You: {command}")
+                            self.status_signal.emit("Processing...")
+
+                            # Speech is queued per chunk, so playback overlaps
+                            # both the next chunk and the next listen
+                            chunks = []
+                            async for chunk in self.jarvis.aprocess_stream(command):
+                                self.jarvis.speak(chunk, async_mode=True)
+                                chunks.append(chunk)
+
+                            self.response_signal.emit(f"JARVIS: {' '.join(chunks)}")
+                            self.status_signal.emit("Ready")
+
+                            if self.listen_once:
+                                self.listen_once = False
+                                self.is_running = False
+                        else:
+                            self.status_signal.emit("Ready")
 
-                        if self.listen_once:
-                            self.listen_once = False
-                            self.is_running = False
                     else:
-                        self.status_signal.emit("Ready")
+                        await self._wake.wait()
+                        self._wake.clear()
 
-                else:
-                    self.msleep(100)
-
-            except Exception as e:
-                self.error_signal.emit(f"Error: {str(e)}")
-                self.status_signal.emit("Error occurred")
+                except Exception as e:
+                    self.error_signal.emit(f"Error: {str(e)}")
+                    self.status_signal.emit("Error occurred")
+        finally:
+            self.finished.emit()
 
     def stop(self):
         """
-        Stop the worker thread
+        Stop the worker loop after the current step
         """
         self.is_running = False
         self.jarvis.is_active = False
+        self._wake.set()
+
+    def wake(self):
+        """
+        Wake the worker loop if it is idle
+        """
+        self._wake.set()
+
+
+class InitWorker(QThread):
+    """
+    Worker thread that builds the JARVIS core off the GUI thread
+    """
+    ready = pyqtSignal(object)
+    error_signal = pyqtSignal(str)
+
+    def run(self):
+        """
+        Construct JarvisCore and hand it to the GUI
+        """
+        try:
+            self.ready.emit(JarvisCore())
+        except Exception as e:
+            self.error_signal.emit(f"Error initializing JARVIS: {str(e)}")
 
 
 class JarvisGUI(QMainWindow):
@@ -80,9 +148,49 @@ class JarvisGUI(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self.jarvis = JarvisCore()
+        self.jarvis = None
         self.worker = None
         self.init_ui()
+        self.set_controls_enabled(False)
+        self.update_status("Initializing...")
+
+        self.init_worker = InitWorker()
+        self.init_worker.ready.connect(self.on_jarvis_ready)
+        self.init_worker.error_signal.connect(self.on_init_error)
+        self.init_worker.start()
+
+    def on_jarvis_ready(self, jarvis_core):
+        """
+        Attach the initialized core and enable the controls
+
+        Args:
+            jarvis_core: Initialized JarvisCore instance
+        """
+        self.jarvis = jarvis_core
+        self.jarvis.conversation_mode = self.conversation_mode_checkbox.isChecked()
+        self.set_controls_enabled(True)
+        self.update_status("Ready")
+
+    def on_init_error(self, message: str):
+        """
+        Report a failed initialization
+
+        Args:
+            message: Error message
+        """
+        self.log_message(message)
+        self.update_status("Error occurred")
+
+    def set_controls_enabled(self, enabled: bool):
+        """
+        Enable or disable the voice controls
+
+        Args:
+            enabled: Whether the controls accept input
+        """
+        self.start_btn.setEnabled(enabled)
+        self.listen_once_btn.setEnabled(enabled)
+        self.stop_btn.setEnabled(False)
 
     def init_ui(self):
         """
@@ -175,6 +283,12 @@ class JarvisGUI(QMainWindow):
         self.log_display.setMinimumHeight(300)
         main_layout.addWidget(self.log_display)
 
+        self.log_lines = deque(maxlen=LOG_MAX_LINES)
+        self.log_dirty = False
+        self.log_timer = QTimer(self)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start(LOG_FLUSH_INTERVAL_MS)
+
         self.status_label = QLabel("Status: Ready")
         self.status_label.setAlignment(Qt.AlignCenter)
         status_font = QFont("Arial", 12, QFont.Bold)
@@ -237,10 +351,23 @@ class JarvisGUI(QMainWindow):
         """
         Add message to log display
 
+        Messages are buffered and shown on the next flush_log tick.
+
         Args:
             message: Message to log
         """
-        self.log_display.append(message)
+        self.log_lines.append(message)
+        self.log_dirty = True
+
+    def flush_log(self):
+        """
+        Redraw the log display if new messages arrived
+        """
+        if not self.log_dirty:
+            return
+
+        self.log_dirty = False
+        self.log_display.setPlainText("\n".join(self.log_lines))
         self.log_display.moveCursor(QTextCursor.End)
 
     def update_status(self, status: str):
@@ -262,7 +389,9 @@ class JarvisGUI(QMainWindow):
             self.worker.response_signal.connect(self.log_message)
             self.worker.status_signal.connect(self.update_status)
             self.worker.error_signal.connect(self.log_message)
+            self.worker.finished.connect(self.on_worker_finished)
             self.worker.start()
+            self.worker.wake()
 
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
@@ -275,13 +404,19 @@ class JarvisGUI(QMainWindow):
         """
         if self.worker:
             self.worker.stop()
-            self.worker.wait()
+        close_vision_system()
+
+        self.stop_btn.setEnabled(False)
+        self.log_message("Stopped listening")
 
+    def on_worker_finished(self):
+        """
+        Re-enable the controls once the worker loop has exited
+        """
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.listen_once_btn.setEnabled(True)
         self.update_status("Ready")
-        self.log_message("Stopped listening")
 
     def listen_once(self):
         """
@@ -293,17 +428,12 @@ class JarvisGUI(QMainWindow):
             self.worker.response_signal.connect(self.log_message)
             self.worker.status_signal.connect(self.update_status)
             self.worker.error_signal.connect(self.log_message)
+            self.worker.finished.connect(self.on_worker_finished)
             self.worker.start()
 
             self.listen_once_btn.setEnabled(False)
             self.start_btn.setEnabled(False)
 
-            def enable_buttons():
-                self.listen_once_btn.setEnabled(True)
-                self.start_btn.setEnabled(True)
-
-            self.worker.finished.connect(enable_buttons)
-
     def toggle_conversation_mode(self, state):
         """
         Toggle conversation mode
@@ -311,15 +441,17 @@ class JarvisGUI(QMainWindow):
         Args:
             state: Checkbox state
         """
-        self.jarvis.conversation_mode = (state == Qt.Checked)
-        mode = "enabled" if self.jarvis.conversation_mode else "disabled"
+        enabled = (state == Qt.Checked)
+        if self.jarvis:
+            self.jarvis.conversation_mode = enabled
+        mode = "enabled" if enabled else "disabled"
         self.log_message(f"Conversation mode {mode}")
 
     def clear_log(self):
         """
         Clear the log display
         """
-        self.log_display.clear()
+        self.log_lines.clear()
         self.log_message("Log cleared")
 
     def show_help(self):
@@ -386,9 +518,9 @@ class JarvisGUI(QMainWindow):
         """
         if self.worker and self.worker.isRunning():
             self.worker.stop()
-            self.worker.wait()
 
-        self.jarvis.speak("Shutting down JARVIS. Goodbye!")
+        if self.jarvis:
+            self.jarvis.speak("Shutting down JARVIS. Goodbye!")
         self.close()
 
     def closeEvent(self, event):
@@ -400,7 +532,8 @@ class JarvisGUI(QMainWindow):
         """
         if self.worker and self.worker.isRunning():
             self.worker.stop()
-            self.worker.wait()
+        self.init_worker.wait()
+        close_vision_system()
         event.accept()
 
 
@@ -411,10 +544,14 @@ def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+
     window = JarvisGUI()
     window.show()
 
-    sys.exit(app.exec_())
+    with loop:
+        sys.exit(loop.run_forever())
 
 
 if __name__ == "__main__":
@@ -3,36 +3,183 @@ JARVIS AI Setup Script
 Automated setup for dependencies and configuration
 """
 
-import subprocess
 import sys
 import os
-import json
 from pathlib import Path
 
 
+# Skip pip's self version check; bytecode compilation is disabled with
+# --no-compile, since pip reads PIP_NO_COMPILE=1 as compile=True
+PIP_ENV_FLAGS = {
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+}
+
+_CONFIG_CACHE = {"mtime": None, "data": None}
+_BAR = "=" * 60
+
+REQUIRED_MODULES = (
+    "PyQt5",
+    "speech_recognition",
+    "pyttsx3",
+    "cv2",
+    "numpy",
+    "bs4",
+    "httpx",
+)
+
+REQUIREMENTS_LOCK = "requirements.lock"
+SETUP_CACHE_PATH = Path("config/.setup_cache.json")
+PIP_CHECK_INTERVAL = 24 * 60 * 60
+
+
 def print_header(message):
     """Print formatted header"""
-    print("\n" + "=" * 60)
-    print(f" {message}")
-    print("=" * 60 + "\n")
+    print(f"\n{_BAR}\n {message}\n{_BAR}\n")
 
 
-def install_requirements():
+def run_pip(args):
+    """Run pip with the given arguments, in this process when it is safe to"""
+    import shutil
+    import subprocess
+
+    # pip cannot safely replace itself while running in-process
+    if "pip" not in args:
+        try:
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            pip_main = None
+
+        if pip_main is not None:
+            import importlib
+
+            saved_env = {key: os.environ.get(key) for key in PIP_ENV_FLAGS}
+            os.environ.update(PIP_ENV_FLAGS)
+            try:
+                returncode = pip_main(args)
+            except SystemExit as e:
+                # pip exits directly on usage errors and --version/--help
+                returncode = 0 if e.code is None else e.code if isinstance(e.code, int) else 1
+            finally:
+                for key, value in saved_env.items():
+                    if value is None:
+                        os.environ.pop(key, None)
+                    else:
+                        os.environ[key] = value
+            importlib.invalidate_caches()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, ["pip"] + args)
+            return
+
+    # Otherwise run pip as a child, copying its output through in large blocks
+    command = [sys.executable, "-m", "pip"] + args
+    sys.stdout.flush()
+
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1 << 16,
+        env={**os.environ, **PIP_ENV_FLAGS}
+    )
+    with process.stdout:
+        shutil.copyfileobj(process.stdout, sys.stdout.buffer, 1 << 16)
+    sys.stdout.buffer.flush()
+
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
+def write_json_atomic(path, data, indent=None):
+    """Write JSON to a temporary file and move it over path in one step"""
+    import json
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    separators = None if indent else (",", ":")
+    tmp_path.write_text(json.dumps(data, indent=indent, separators=separators))
+    os.replace(tmp_path, path)
+
+
+def load_setup_cache():
+    """Load state remembered from previous setup runs"""
+    import json
+
+    try:
+        with open(SETUP_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_setup_cache(cache):
+    """Remember state for the next setup run"""
+    try:
+        write_json_atomic(SETUP_CACHE_PATH, cache)
+    except OSError as e:
+        print(f"Warning: Could not save setup cache: {e}")
+
+
+def requirements_digest(path):
+    """Fingerprint a requirements file together with the interpreter it is installed into"""
+    import hashlib
+
+    try:
+        digest = hashlib.sha1(Path(path).read_bytes())
+    except OSError:
+        return None
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+
+def install_requirements(offline=False):
     """Install required packages from requirements.txt"""
+    import subprocess
+    import time
+    from importlib.metadata import version
+
     print_header("Installing Dependencies")
 
-    try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "--upgrade", "pip"
-        ])
-        print("Pip upgraded successfully\n")
-    except subprocess.CalledProcessError as e:
-        print(f"Warning: Could not upgrade pip: {e}\n")
+    if offline:
+        print("Offline mode, skipping package installation.")
+        return True
+
+    cache = load_setup_cache()
+    locked = os.path.exists(REQUIREMENTS_LOCK)
+    requirements_file = REQUIREMENTS_LOCK if locked else "requirements.txt"
+
+    digest = requirements_digest(requirements_file)
+    if digest is not None and cache.get("requirements_digest") == digest:
+        print(f"{requirements_file} unchanged since the last install, skipping pip.")
+        return True
+
+    upgrade_pip = not locked and (
+        cache.get("pip_version") != version("pip")
+        or time.time() - cache.get("pip_checked_at", 0) >= PIP_CHECK_INTERVAL
+    )
+
+    args = ["install", "--no-compile"]
+    if locked:
+        # Every package is pinned with hashes, so pip can skip dependency resolution.
+        # pip itself has no hash there and cannot be upgraded in the same run.
+        print(f"Installing from {REQUIREMENTS_LOCK}\n")
+        args += ["--no-deps", "--require-hashes", "-r", REQUIREMENTS_LOCK]
+    else:
+        if not upgrade_pip:
+            print("Pip was checked within the last day, skipping upgrade\n")
+        args += ["-r", "requirements.txt"]
+
+    if upgrade_pip:
+        try:
+            run_pip(["install", "--no-compile", "--upgrade", "pip"])
+            cache["pip_version"] = version("pip")
+            cache["pip_checked_at"] = time.time()
+        except subprocess.CalledProcessError as e:
+            print(f"Warning: Could not upgrade pip: {e}\n")
 
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ])
+        run_pip(args)
+        cache["requirements_digest"] = digest
+        save_setup_cache(cache)
         print("\nAll dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -40,13 +187,31 @@ def install_requirements():
         return False
 
 
-def setup_config():
-    """Setup configuration file"""
+def load_config(config_path):
+    """Load config.json, reusing the parsed copy while the file is unchanged"""
+    import json
+
+    try:
+        mtime = config_path.stat().st_mtime
+    except OSError:
+        return {}
+
+    if _CONFIG_CACHE["mtime"] != mtime:
+        with open(config_path, 'r') as f:
+            _CONFIG_CACHE["data"] = json.load(f)
+        _CONFIG_CACHE["mtime"] = mtime
+
+    return dict(_CONFIG_CACHE["data"])
+
+
+def setup_config(gemini_api=None, openai_api=None, interactive=True):
+    """Setup configuration file, prompting for API keys unless they are given"""
     print_header("Setting Up Configuration")
 
     config_path = Path("config/config.json")
+    keys_given = bool(gemini_api or openai_api)
 
-    if config_path.exists():
+    if config_path.exists() and interactive and not keys_given:
         print("Configuration file already exists.")
         response = input("Do you want to reconfigure? (y/n): ").lower()
         if response != 'y':
@@ -54,67 +219,71 @@ def setup_config():
             return True
 
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = load_config(config_path)
     except Exception as e:
         print(f"Error reading config: {e}")
         config = {}
+    original_config = dict(config)
 
     print("\nCurrent API Keys Configuration:")
     print(f"Gemini API: {'Set' if config.get('GEMINI_API') else 'Not Set'}")
     print(f"OpenAI API: {'Set' if config.get('OPENAI_API') else 'Not Set'}")
 
-    update = input("\nDo you want to update API keys? (y/n): ").lower()
+    if not keys_given:
+        if not interactive or input("\nDo you want to update API keys? (y/n): ").lower() != 'y':
+            print("Configuration unchanged.")
+            return True
 
-    if update == 'y':
         print("\nEnter API keys (press Enter to skip):")
-
         gemini_api = input("Gemini API Key: ").strip()
-        if gemini_api:
-            config['GEMINI_API'] = gemini_api
-
         openai_api = input("OpenAI API Key: ").strip()
-        if openai_api:
-            config['OPENAI_API'] = openai_api
 
-        try:
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
-            print("\nConfiguration saved successfully!")
-            return True
-        except Exception as e:
-            print(f"\nError saving configuration: {e}")
-            return False
-    else:
-        print("Configuration unchanged.")
+    if gemini_api:
+        config['GEMINI_API'] = gemini_api
+    if openai_api:
+        config['OPENAI_API'] = openai_api
+
+    if config == original_config:
+        print("\nConfiguration unchanged.")
         return True
 
+    # config.json is edited by hand, so it keeps its indentation
+    try:
+        write_json_atomic(config_path, config, indent=2)
+        print("\nConfiguration saved successfully!")
+        return True
+    except Exception as e:
+        print(f"\nError saving configuration: {e}")
+        return False
+
 
 def check_pyaudio():
     """Check and provide instructions for PyAudio installation"""
+    import importlib.util
+
     print_header("Checking PyAudio Installation")
 
-    try:
-        import pyaudio
+    # Locate the module without importing it, which would initialize PortAudio
+    if importlib.util.find_spec("pyaudio") is not None:
         print("PyAudio is already installed!")
         return True
-    except ImportError:
-        print("PyAudio not found. Installing...")
-
-        if sys.platform == "win32":
-            print("\nFor Windows, you may need to install PyAudio manually:")
-            print("1. Download the appropriate .whl file from:")
-            print("   https://www.lfd.uci.edu/~gohlke/pythonlibs/#pyaudio")
-            print("2. Install using: pip install [downloaded_file].whl")
-        elif sys.platform == "darwin":
-            print("\nFor macOS, run:")
-            print("   brew install portaudio")
-            print("   pip install pyaudio")
-        else:
-            print("\nFor Linux, run:")
-            print("   sudo apt-get install python3-pyaudio portaudio19-dev")
 
-        return False
+    print("PyAudio not found. Installing...")
+
+    if sys.platform == "win32":
+        print("\nFor Windows, you may need to install PyAudio manually:")
+        print("1. Download the appropriate .whl file from:")
+        print("   https://www.lfd.uci.edu/~gohlke/pythonlibs/#pyaudio")
+        print("2. Install using: pip install [downloaded_file].whl")
+    elif sys.platform == "darwin":
+        print("\nFor macOS, run:")
+        print("   brew install portaudio")
+        print("   pip install pyaudio")
+    else:
+        print("\nFor Linux, run:")
+        print("   sudo apt-get install python3-pyaudio portaudio19-dev")
+
+    return False
 
 
 def create_directories():
@@ -129,7 +298,9 @@ def create_directories():
     ]
 
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        # On re-runs every directory exists, so a stat is all that is needed
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
         print(f"Created: {directory}")
 
     print("\nDirectory structure created successfully!")
@@ -138,28 +309,17 @@ def create_directories():
 
 def test_imports():
     """Test if all required modules can be imported"""
-    print_header("Testing Module Imports")
+    import importlib.util
 
-    required_modules = [
-        "PyQt5",
-        "speech_recognition",
-        "pyttsx3",
-        "cv2",
-        "numpy",
-        "requests",
-        "bs4",
-        "wikipedia"
-    ]
+    print_header("Testing Module Imports")
 
-    failed_modules = []
+    # Locating each module is enough; executing it would load Qt, OpenCV, etc.
+    results = {module: importlib.util.find_spec(module) is not None
+               for module in REQUIRED_MODULES}
+    failed_modules = [module for module, found in results.items() if not found]
 
-    for module in required_modules:
-        try:
-            __import__(module)
-            print(f"✓ {module}")
-        except ImportError:
-            print(f"✗ {module} - FAILED")
-            failed_modules.append(module)
+    for module, found in results.items():
+        print(f"✓ {module}" if found else f"✗ {module} - FAILED")
 
     if failed_modules:
         print(f"\nWarning: The following modules failed to import: {', '.join(failed_modules)}")
@@ -169,8 +329,26 @@ def test_imports():
         return True
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options for unattended setup"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Set up JARVIS AI Assistant")
+    parser.add_argument("--yes", "-y", action="store_true",
+                        help="run without confirmation prompts")
+    parser.add_argument("--gemini-key", help="Gemini API key to store in config.json")
+    parser.add_argument("--openai-key", help="OpenAI API key to store in config.json")
+    parser.add_argument("--skip-config", action="store_true",
+                        help="leave config.json untouched")
+    parser.add_argument("--offline", action="store_true",
+                        help="skip installing packages")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main setup function"""
+    args = parse_args(argv)
+
     print_header("JARVIS AI Assistant - Setup")
 
     print("This script will set up JARVIS AI Assistant on your system.")
@@ -180,19 +358,25 @@ def main():
     print("  3. Configure API keys")
     print("  4. Test imports")
 
-    response = input("\nDo you want to continue? (y/n): ").lower()
+    if not args.yes:
+        response = input("\nDo you want to continue? (y/n): ").lower()
 
-    if response != 'y':
-        print("Setup cancelled.")
-        return
+        if response != 'y':
+            print("Setup cancelled.")
+            return
 
     success = True
 
+    # The phases run in order on purpose: installing writes the setup cache
+    # and setup_config writes config.json, both under the directories created
+    # first, and the PyAudio and import checks inspect what pip installed
     success = create_directories() and success
 
-    success = install_requirements() and success
+    success = install_requirements(offline=args.offline) and success
 
-    success = setup_config() and success
+    if not args.skip_config:
+        success = setup_config(args.gemini_key, args.openai_key,
+                               interactive=not args.yes) and success
 
     check_pyaudio()
 
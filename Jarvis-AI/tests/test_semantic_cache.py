@@ -0,0 +1,71 @@
+"""
+Tests for the semantic response cache
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from func.semantic_cache import SemanticCache
+
+
+class StubModel:
+    """
+    Embedding model stub mapping each known text to a fixed vector
+    """
+
+    VECTORS = {
+        "what's the weather": [1.0, 0.0, 0.0],
+        "weather today": [0.99, 0.1, 0.0],
+        "tell me a joke": [0.0, 1.0, 0.0],
+        "open notepad": [0.0, 0.0, 1.0],
+    }
+
+    def embed(self, texts):
+        for text in texts:
+            yield np.array(self.VECTORS[text], dtype=np.float32)
+
+
+def make_cache(max_entries=500):
+    cache = SemanticCache(max_entries=max_entries)
+    cache._model = StubModel()
+    return cache
+
+
+def test_lookup_after_store_hits_similar_question():
+    cache = make_cache()
+
+    response, vector = cache.lookup("what's the weather")
+    assert response is None
+    cache.store(vector, "It is sunny")
+
+    response, _ = cache.lookup("weather today")
+    assert response == "It is sunny"
+
+
+def test_lookup_misses_dissimilar_question():
+    cache = make_cache()
+
+    _, vector = cache.lookup("what's the weather")
+    cache.store(vector, "It is sunny")
+
+    response, _ = cache.lookup("tell me a joke")
+    assert response is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = make_cache(max_entries=2)
+
+    for question in ("what's the weather", "tell me a joke"):
+        _, vector = cache.lookup(question)
+        cache.store(vector, question)
+
+    # Touch the weather entry so the joke becomes least recently used
+    cache.lookup("weather today")
+
+    _, vector = cache.lookup("open notepad")
+    cache.store(vector, "open notepad")
+
+    assert cache.lookup("tell me a joke")[0] is None
+    assert cache.lookup("what's the weather")[0] == "what's the weather"
+    assert cache.lookup("open notepad")[0] == "open notepad"